@@ -7,15 +7,14 @@ from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework.permissions import AllowAny
 from rest_framework.authentication import SessionAuthentication, BasicAuthentication
-from rest_framework.pagination import PageNumberPagination
 from django.contrib.auth import get_user_model
-from django.db.models import Count
 
 from .models import UserPreferences
 from .serializer import UserSerializer, UserPreferencesSerializer
 from .permissions import PublicOrOwnerPermission, IsOwnerOrAdmin
 
-from core.media.models import Favourite
+from core.media.favourites import user_favourites
+from core.pagination import KeysetPagination
 from core.media.serializers import FavouriteSerializer
 
 User = get_user_model()
@@ -158,14 +157,16 @@ class UserPreferencesView(generics.RetrieveUpdateAPIView):
         except UserPreferences.DoesNotExist:
             return Response(status=status.HTTP_404_NOT_FOUND)
 
-class FavouritesPagination(PageNumberPagination):
+class FavouritesPagination(KeysetPagination):
+    ordering_field = 'added_at'
     page_size = 24
     page_size_query_param = 'page_size'
     max_page_size = 100
     
 class UserFavouritesView(generics.ListAPIView):
     """
-    GET /api/accounts/users/<username>/favourites/
+    GET /api/accounts/users/<username>/favourites/?cursor=...&page_size=24[&count=true]
+    Newest first; follow `next` for older favourites. ?page= is still accepted.
     """
     serializer_class = FavouriteSerializer
     permission_classes = [PublicOrOwnerPermission]
@@ -173,15 +174,9 @@ class UserFavouritesView(generics.ListAPIView):
 
     def get_queryset(self):
         username = self.kwargs['username']
+        user_id = User.objects.filter(username=username).values_list('id', flat=True).first()
         # Only return favourites for that user, newest first
-        return (
-            Favourite.objects
-            .filter(user__username=username)
-            .select_related('media')
-            # annotate each media with its total favourites count
-            .annotate(media__favourites_count=Count('media__favourite'))
-            .order_by('-added_at')
-        )
+        return user_favourites(user_id)
     
 class ChangePasswordView(APIView):
     """
@@ -0,0 +1,115 @@
+# backend/core/analytics/buffer.py
+
+import atexit
+import logging
+import os
+import queue
+import threading
+
+from django.conf import settings
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+
+class RequestLogBuffer:
+    """
+    Bounded in-process queue of APIRequest rows, written in bulk by a daemon
+    thread. Recording never touches the database; when the queue is full the
+    row is dropped and counted instead of blocking the request.
+    """
+
+    def __init__(self, max_size, flush_interval, batch_size):
+        self.max_size = max_size
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._queue = queue.Queue(maxsize=max_size)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+        self._counts = {"recorded": 0, "dropped": 0, "flushed": 0, "failed": 0}
+
+    def _count(self, name, n=1):
+        with self._lock:
+            self._counts[name] += n
+
+    def record(self, row):
+        """Queue an unsaved APIRequest; returns False if it had to be dropped."""
+        self._ensure_thread()
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            self._count("dropped")
+            return False
+        self._count("recorded")
+        return True
+
+    def _ensure_thread(self):
+        # Started lazily and again after a fork, since threads don't survive one
+        if self._pid == os.getpid() and self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._pid == os.getpid() and self._thread is not None and self._thread.is_alive():
+                return
+            if self._pid != os.getpid():
+                self._queue = queue.Queue(maxsize=self.max_size)
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name="api-request-log", daemon=True)
+            self._thread.start()
+
+    def _take(self, block):
+        """Take up to batch_size queued rows, waiting up to flush_interval for the first."""
+        rows = []
+        try:
+            rows.append(
+                self._queue.get(timeout=self.flush_interval) if block else self._queue.get_nowait()
+            )
+            while len(rows) < self.batch_size:
+                rows.append(self._queue.get_nowait())
+        except queue.Empty:
+            pass
+        return rows
+
+    def flush(self, block=False):
+        """Write one batch with a multi-row INSERT. Returns the number of rows written."""
+        from core.analytics.models import APIRequest
+
+        rows = self._take(block)
+        if not rows:
+            return 0
+        try:
+            APIRequest.objects.bulk_create(rows, batch_size=self.batch_size)
+        except Exception as e:
+            # Telemetry is best-effort: drop the batch rather than back up the queue
+            self._count("failed", len(rows))
+            logger.error(f"Failed to write {len(rows)} API request logs: {e}")
+            return 0
+        self._count("flushed", len(rows))
+        return len(rows)
+
+    def _run(self):
+        while True:
+            close_old_connections()
+            try:
+                self.flush(block=True)
+            except Exception as e:
+                logger.error(f"API request log flush failed: {e}")
+
+    def drain(self):
+        """Flush everything queued so far, e.g. at interpreter exit."""
+        while self.flush():
+            pass
+
+    def stats(self):
+        """Counters for this process, plus the current queue depth."""
+        with self._lock:
+            counts = dict(self._counts)
+        return {**counts, "queued": self._queue.qsize(), "max_size": self.max_size}
+
+
+buffer = RequestLogBuffer(
+    max_size=settings.ANALYTICS_BUFFER_SIZE,
+    flush_interval=settings.ANALYTICS_FLUSH_INTERVAL,
+    batch_size=settings.ANALYTICS_FLUSH_BATCH_SIZE,
+)
+atexit.register(buffer.drain)
@@ -0,0 +1,59 @@
+# backend/core/analytics/management/commands/rollup_api_requests.py
+
+import logging
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from core.analytics.models import RequestRollup
+from core.analytics.partitions import default_partition_rows, ensure_partitions
+from core.analytics.rollups import rollup
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Create upcoming api_requests partitions and update the minute and hour "
+        "request rollups incrementally."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=None,
+            help="Keep running, rolling up every INTERVAL seconds (default: run once).",
+        )
+        parser.add_argument(
+            "--backfill-hours",
+            type=float,
+            default=24,
+            help="How far back the first run of each resolution starts.",
+        )
+
+    def handle(self, *args, **options):
+        backfill = timedelta(hours=options["backfill_hours"])
+        while True:
+            close_old_connections()
+            # Kept apart so a partition problem never holds up the rollups
+            try:
+                ensure_partitions()
+                default_partition_rows()
+            except Exception as e:
+                logger.error(f"Ensuring api_requests partitions failed: {e}")
+
+            try:
+                for resolution in (RequestRollup.MINUTE, RequestRollup.HOUR):
+                    written = rollup(resolution, backfill)
+                    self.stdout.write(f"Updated {written} {resolution} rollups.")
+            except Exception as e:
+                if options["interval"] is None:
+                    raise
+                logger.error(f"Request rollup failed, retrying: {e}")
+
+            if options["interval"] is None:
+                return
+            time.sleep(options["interval"])
@@ -0,0 +1,233 @@
+# backend/core/analytics/metrics.py
+
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django_redis import get_redis_connection
+
+logger = logging.getLogger(__name__)
+
+# v2: fields hold raw JSON label values rather than pre-quoted label strings
+KEY_PREFIX = "metrics:v2:"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# name -> (type, help text, label names)
+METRICS = {
+    "http_request_duration_seconds": (
+        "histogram",
+        "API request latency by URL name, method and status.",
+        ("view", "method", "status"),
+    ),
+    "http_request_db_queries_total": (
+        "counter",
+        "Database queries run while serving API requests.",
+        ("view",),
+    ),
+    "http_request_db_seconds_total": (
+        "counter",
+        "Time API requests spent waiting on database queries.",
+        ("view",),
+    ),
+    "openverse_request_duration_seconds": (
+        "histogram",
+        "Openverse API call latency by endpoint and outcome, including retries.",
+        ("endpoint", "status"),
+    ),
+    "cache_requests_total": (
+        "counter",
+        "Application cache lookups by cache and result.",
+        ("cache", "result"),
+    ),
+}
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _label_values(name, labels):
+    """Redis field for a label set: the raw values in METRICS order, as JSON."""
+    return json.dumps([str(labels.get(label, "")) for label in METRICS[name][2]])
+
+
+def _split_field(field):
+    """Label values of a stored field and what follows them, e.g. 'sum' or 'bucket|0.5'."""
+    values, end = json.JSONDecoder().raw_decode(field)
+    return tuple(values), field[end:].lstrip("|")
+
+
+def _format_labels(names, values):
+    """Label set in the exposition format; the one place label values are quoted."""
+    return ",".join(f'{label}="{_escape(value)}"' for label, value in zip(names, values))
+
+
+class MetricsRegistry:
+    """
+    Counters and histograms aggregated across every worker in Redis.
+
+    Updates are summed in process memory and a daemon thread adds them to one
+    Redis hash per metric every flush_interval seconds with a single pipeline,
+    so recording a metric never costs a network round trip. Histogram buckets
+    are stored per bucket and made cumulative when exported.
+    """
+
+    def __init__(self, flush_interval):
+        self.flush_interval = flush_interval
+        self._pending = defaultdict(int)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+
+    def inc(self, name, labels, value=1):
+        self._add(name, _label_values(name, labels), value)
+
+    def observe(self, name, labels, seconds):
+        field = _label_values(name, labels)
+        bucket = next((b for b in LATENCY_BUCKETS if seconds <= b), "+Inf")
+        self._add(name, f"{field}|bucket|{bucket}", 1)
+        self._add(name, f"{field}|sum", float(seconds))
+        self._add(name, f"{field}|count", 1)
+
+    def _add(self, name, field, value):
+        self._ensure_thread()
+        with self._lock:
+            self._pending[(name, field)] += value
+
+    def _ensure_thread(self):
+        # Started lazily and again after a fork, since threads don't survive one
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pending = defaultdict(int)
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name="metrics-flush", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            time.sleep(self.flush_interval)
+            self.flush()
+
+    def flush(self):
+        """Add this process's pending updates to the shared Redis hashes."""
+        with self._lock:
+            pending, self._pending = self._pending, defaultdict(int)
+        if not pending:
+            return
+
+        try:
+            pipe = get_redis_connection("default").pipeline(transaction=False)
+            for (name, field), value in pending.items():
+                if isinstance(value, float):
+                    pipe.hincrbyfloat(KEY_PREFIX + name, field, value)
+                else:
+                    pipe.hincrby(KEY_PREFIX + name, field, value)
+            pipe.execute()
+        except Exception as e:
+            # Keep the updates for the next attempt
+            logger.warning(f"Failed to flush metrics to Redis: {e}")
+            with self._lock:
+                for key, value in pending.items():
+                    self._pending[key] += value
+
+    def export(self):
+        """All metrics in the Prometheus text exposition format."""
+        self.flush()
+        pipe = get_redis_connection("default").pipeline(transaction=False)
+        for name in METRICS:
+            pipe.hgetall(KEY_PREFIX + name)
+        stored = {
+            name: {field.decode(): value.decode() for field, value in values.items()}
+            for name, values in zip(METRICS, pipe.execute())
+        }
+
+        lines = []
+        for name, (kind, help_text, label_names) in METRICS.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            if kind == "histogram":
+                lines.extend(_histogram_lines(name, stored[name]))
+            else:
+                series = sorted((_split_field(f)[0], v) for f, v in stored[name].items())
+                for values, value in series:
+                    lines.append(f"{name}{{{_format_labels(label_names, values)}}} {value}")
+
+        lines.extend(_hit_ratio_lines(stored["cache_requests_total"]))
+        return "\n".join(lines) + "\n"
+
+
+def _histogram_lines(name, fields):
+    label_names = METRICS[name][2]
+    series = defaultdict(dict)
+    for field, value in fields.items():
+        values, part = _split_field(field)
+        series[values][part] = value
+
+    lines = []
+    for values, parts in sorted(series.items()):
+        labels = _format_labels(label_names, values)
+        cumulative = 0
+        for bucket in LATENCY_BUCKETS:
+            cumulative += int(parts.get(f"bucket|{bucket}", 0))
+            le = _format_labels((*label_names, "le"), (*values, bucket))
+            lines.append(f"{name}_bucket{{{le}}} {cumulative}")
+        count = int(parts.get("count", 0))
+        le = _format_labels((*label_names, "le"), (*values, "+Inf"))
+        lines.append(f"{name}_bucket{{{le}}} {count}")
+        lines.append(f"{name}_sum{{{labels}}} {float(parts.get('sum', 0))}")
+        lines.append(f"{name}_count{{{labels}}} {count}")
+    return lines
+
+
+def _hit_ratio_lines(cache_fields):
+    """Derived hit ratio per cache; stale search results count as hits."""
+    totals = defaultdict(lambda: [0, 0])
+    for field, value in cache_fields.items():
+        (cache_name, result), _ = _split_field(field)
+        totals[cache_name][1] += int(value)
+        if result in ("hit", "stale"):
+            totals[cache_name][0] += int(value)
+
+    lines = [
+        "# HELP cache_hit_ratio Share of application cache lookups answered from the cache.",
+        "# TYPE cache_hit_ratio gauge",
+    ]
+    for cache_name, (hits, total) in sorted(totals.items()):
+        labels = _format_labels(("cache",), (cache_name,))
+        lines.append(f"cache_hit_ratio{{{labels}}} {hits / total if total else 0.0}")
+    return lines
+
+
+registry = MetricsRegistry(flush_interval=settings.METRICS_FLUSH_INTERVAL)
+atexit.register(registry.flush)
+
+
+def observe_request(view, method, status, seconds, db_queries, db_seconds):
+    registry.observe(
+        "http_request_duration_seconds", {"view": view, "method": method, "status": status}, seconds
+    )
+    registry.inc("http_request_db_queries_total", {"view": view}, db_queries)
+    registry.inc("http_request_db_seconds_total", {"view": view}, float(db_seconds))
+
+
+def observe_openverse(endpoint, status, seconds):
+    """Record an Openverse call; detail paths are grouped as '<type>/detail'."""
+    parts = endpoint.strip("/").split("/")
+    endpoint = parts[0] if len(parts) == 1 else f"{parts[0]}/detail"
+    registry.observe(
+        "openverse_request_duration_seconds", {"endpoint": endpoint, "status": status}, seconds
+    )
+
+
+def count_cache(cache_name, result):
+    """Count a cache lookup; result is 'hit', 'miss' or 'stale'."""
+    registry.inc("cache_requests_total", {"cache": cache_name, "result": result})
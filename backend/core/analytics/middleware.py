@@ -0,0 +1,179 @@
+# backend/core/analytics/middleware.py
+
+import logging
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.utils import timezone
+from django.utils.functional import SimpleLazyObject, empty
+
+from core.analytics.buffer import buffer
+from core.analytics.metrics import observe_request
+from core.analytics.models import APIRequest
+
+logger = logging.getLogger(__name__)
+
+
+def url_name(request):
+    """The resolved URL name of a request, the endpoint label for logs and metrics."""
+    match = getattr(request, "resolver_match", None)
+    return match.url_name if match is not None and match.url_name else "unmatched"
+
+
+class APIRequestLoggingMiddleware:
+    """
+    Record method, path, status, user and timings of API requests.
+    Rows are handed to the in-process buffer, which writes them in bulk off the
+    request path, so logging never adds a database round trip.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.prefix = settings.ANALYTICS_LOG_PATH_PREFIX
+        self.max_url_length = APIRequest._meta.get_field("request_url").max_length
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        requested_at = timezone.now()
+        response = self.get_response(request)
+        self.record(request, response, requested_at)
+        return response
+
+    async def __acall__(self, request):
+        requested_at = timezone.now()
+        response = await self.get_response(request)
+        self.record(request, response, requested_at)
+        return response
+
+    @staticmethod
+    def user_id(request):
+        """
+        The id of a user the request already resolved, or None. DRF copies the
+        JWT-authenticated user onto the Django request; a session user that was
+        never loaded is not looked up just to be logged.
+        """
+        user = getattr(request, "user", None)
+        if user is None or (isinstance(user, SimpleLazyObject) and user._wrapped is empty):
+            return None
+        return user.pk if user.is_authenticated else None
+
+    def record(self, request, response, requested_at):
+        if not settings.ANALYTICS_LOG_REQUESTS or not request.path.startswith(self.prefix):
+            return
+        try:
+            buffer.record(
+                APIRequest(
+                    user_id=self.user_id(request),
+                    request_method=request.method,
+                    request_url=request.get_full_path()[: self.max_url_length],
+                    url_name=url_name(request),
+                    response_status=response.status_code,
+                    requested_at=requested_at,
+                    responded_at=timezone.now(),
+                )
+            )
+        except Exception as e:
+            logger.warning(f"Failed to record API request {request.method} {request.path}: {e}")
+
+
+class QueryStats:
+    """Database query count and time of one request."""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+
+# Stats of the request being served. Context variables follow the request into
+# sync_to_async threads, so ORM work under ASGI is counted too.
+_query_stats = ContextVar("query_stats", default=None)
+
+
+def count_queries(execute, sql, params, many, context):
+    """Execute wrapper adding each query to the current request's QueryStats."""
+    stats = _query_stats.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.count += 1
+        stats.seconds += time.perf_counter() - start
+
+
+def install_query_counter(sender, connection, **kwargs):
+    # Installed on every connection, whichever thread opens it
+    if count_queries not in connection.execute_wrappers:
+        connection.execute_wrappers.append(count_queries)
+
+
+connection_created.connect(install_query_counter)
+
+
+class RequestMetricsMiddleware:
+    """
+    Observe latency, status and database usage of API requests per URL name
+    into the shared metrics registry (exported at /api/analytics/metrics/).
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.prefix = settings.ANALYTICS_LOG_PATH_PREFIX
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not request.path.startswith(self.prefix):
+            return self.get_response(request)
+
+        queries = QueryStats()
+        start = time.perf_counter()
+        token = _query_stats.set(queries)
+        try:
+            response = self.get_response(request)
+        finally:
+            _query_stats.reset(token)
+        self.record(request, response, time.perf_counter() - start, queries)
+        return response
+
+    async def __acall__(self, request):
+        if not request.path.startswith(self.prefix):
+            return await self.get_response(request)
+
+        queries = QueryStats()
+        start = time.perf_counter()
+        token = _query_stats.set(queries)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _query_stats.reset(token)
+        self.record(request, response, time.perf_counter() - start, queries)
+        return response
+
+    def record(self, request, response, seconds, queries):
+        try:
+            observe_request(
+                url_name(request),
+                request.method,
+                str(response.status_code),
+                seconds,
+                queries.count,
+                queries.seconds,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to record metrics for {request.method} {request.path}: {e}")
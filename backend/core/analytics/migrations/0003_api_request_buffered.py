@@ -0,0 +1,32 @@
+# Generated by Django 5.1.7 on 2026-10-18 13:44
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0002_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="apirequest",
+            name="request_url",
+            field=models.CharField(max_length=1000),
+        ),
+        migrations.AlterField(
+            model_name="apirequest",
+            name="requested_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AlterField(
+            model_name="apirequest",
+            name="user",
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL),
+        ),
+    ]
@@ -0,0 +1,147 @@
+# Generated by Django 5.1.7 on 2026-10-18 13:46
+
+import re
+
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+from core.analytics.partitions import create_partition_sql, month_start, next_month
+
+MONTHS_AHEAD = 2
+
+
+def _indexes_and_foreign_keys(cursor, table):
+    """Definitions of a table's secondary indexes and foreign keys, to recreate them elsewhere."""
+    cursor.execute(
+        """
+        SELECT indexname, indexdef FROM pg_indexes
+        WHERE tablename = %s AND indexname NOT IN (
+            SELECT conname FROM pg_constraint WHERE conrelid = %s::regclass AND contype = 'p'
+        )
+        """,
+        [table, table],
+    )
+    indexes = cursor.fetchall()
+    cursor.execute(
+        """
+        SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint
+        WHERE conrelid = %s::regclass AND contype = 'f'
+        """,
+        [table],
+    )
+    return indexes, cursor.fetchall()
+
+
+def _restore(cursor, table, indexes, foreign_keys):
+    for _, indexdef in indexes:
+        # indexdef reads "CREATE INDEX name ON [ONLY] public.<old table> USING ..."
+        cursor.execute(re.sub(r" ON (ONLY )?\S+ USING ", f' ON "{table}" USING ', indexdef, count=1))
+    for name, definition in foreign_keys:
+        cursor.execute(f'ALTER TABLE "{table}" ADD CONSTRAINT "{name}" {definition}')
+
+
+def _replace_table(cursor, partitioned):
+    """Rebuild api_requests as a monthly partitioned table, or back into a plain one."""
+    cursor.execute('ALTER TABLE "api_requests" RENAME TO "api_requests_old"')
+    indexes, foreign_keys = _indexes_and_foreign_keys(cursor, "api_requests_old")
+
+    if partitioned:
+        cursor.execute(
+            'CREATE TABLE "api_requests" (LIKE "api_requests_old" INCLUDING DEFAULTS) '
+            'PARTITION BY RANGE ("requested_at")'
+        )
+        cursor.execute('SELECT MIN("requested_at") FROM "api_requests_old"')
+        oldest = cursor.fetchone()[0]
+        start = month_start(min(filter(None, [oldest, timezone.now()])))
+        last = month_start(timezone.now())
+        for _ in range(MONTHS_AHEAD):
+            last = next_month(last)
+        while start <= last:
+            cursor.execute(create_partition_sql(start))
+            start = next_month(start)
+        cursor.execute('CREATE TABLE "api_requests_default" PARTITION OF "api_requests" DEFAULT')
+    else:
+        cursor.execute('CREATE TABLE "api_requests" (LIKE "api_requests_old" INCLUDING DEFAULTS)')
+
+    cursor.execute('ALTER TABLE "api_requests" ALTER COLUMN "id" DROP DEFAULT')
+    cursor.execute('INSERT INTO "api_requests" SELECT * FROM "api_requests_old"')
+    cursor.execute('DROP TABLE "api_requests_old" CASCADE')
+
+    # Constraint and index names are free again now the old table is gone.
+    # Unique constraints on a partitioned table must include the partition key.
+    primary_key = '"id", "requested_at"' if partitioned else '"id"'
+    cursor.execute(f'ALTER TABLE "api_requests" ADD PRIMARY KEY ({primary_key})')
+    _restore(cursor, "api_requests", indexes, foreign_keys)
+
+    # Identity columns aren't allowed on partitioned tables before Postgres 17
+    cursor.execute('CREATE SEQUENCE IF NOT EXISTS "api_requests_id_seq" OWNED BY "api_requests"."id"')
+    cursor.execute(
+        """SELECT setval('"api_requests_id_seq"', COALESCE(MAX("id"), 0) + 1, false) FROM "api_requests" """
+    )
+    cursor.execute(
+        """ALTER TABLE "api_requests" ALTER COLUMN "id" SET DEFAULT nextval('"api_requests_id_seq"')"""
+    )
+
+
+def partition(apps, schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        _replace_table(cursor, partitioned=True)
+
+
+def unpartition(apps, schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        _replace_table(cursor, partitioned=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0003_api_request_buffered"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RequestRollup",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("resolution", models.CharField(choices=[("minute", "Minute"), ("hour", "Hour")], max_length=10)),
+                ("bucket", models.DateTimeField()),
+                ("url_name", models.CharField(max_length=100)),
+                ("request_count", models.PositiveIntegerField(default=0)),
+                ("error_count", models.PositiveIntegerField(default=0)),
+                ("p50_ms", models.FloatField(null=True)),
+                ("p95_ms", models.FloatField(null=True)),
+                ("p99_ms", models.FloatField(null=True)),
+            ],
+            options={
+                "verbose_name": "request rollup",
+                "verbose_name_plural": "request rollups",
+                "db_table": "api_request_rollups",
+                "ordering": ["resolution", "-bucket", "url_name"],
+            },
+        ),
+        migrations.AlterModelOptions(
+            name="apirequest",
+            options={"verbose_name": "API Request", "verbose_name_plural": "API Requests"},
+        ),
+        migrations.AddField(
+            model_name="apirequest",
+            name="url_name",
+            field=models.CharField(default="", max_length=100),
+        ),
+        migrations.AddIndex(
+            model_name="apirequest",
+            index=models.Index(fields=["requested_at"], name="api_request_requested_at_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="requestrollup",
+            index=models.Index(fields=["resolution", "bucket"], name="request_rollup_bucket_idx"),
+        ),
+        migrations.AddConstraint(
+            model_name="requestrollup",
+            constraint=models.UniqueConstraint(fields=("resolution", "url_name", "bucket"), name="unique_request_rollup"),
+        ),
+        migrations.RunPython(partition, unpartition),
+    ]
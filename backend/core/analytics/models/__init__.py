@@ -1,3 +1,4 @@
 # backend/core/analytics/models/__init__.py
 
 from .api_request import APIRequest
+from .request_rollup import RequestRollup
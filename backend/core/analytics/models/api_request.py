@@ -2,21 +2,33 @@
 
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
 
 
 class APIRequest(models.Model):
-    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    """
+    One logged API request. The table is range-partitioned by month on
+    requested_at (see migration 0004 and core.analytics.partitions), so its
+    primary key is (id, requested_at) in the database; Django only sees id.
+    Dashboards read RequestRollup instead of scanning these rows.
+    """
+
+    # Null for anonymous requests; rows are written by core.analytics.buffer
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True)
     request_method = models.CharField(max_length=10)
-    request_url = models.URLField()
+    # Path and query string of the request
+    request_url = models.CharField(max_length=1000)
+    # Resolved URL name, the endpoint rollups are grouped by
+    url_name = models.CharField(max_length=100, default="")
     response_status = models.PositiveIntegerField()
-    requested_at = models.DateTimeField(auto_now_add=True)
+    requested_at = models.DateTimeField(default=timezone.now)
     responded_at = models.DateTimeField()
 
     class Meta:
         db_table = "api_requests"
         verbose_name = "API Request"
         verbose_name_plural = "API Requests"
-        ordering = ["-requested_at"]
         indexes = [
             models.Index(fields=["user", "requested_at"]),
+            models.Index(fields=["requested_at"], name="api_request_requested_at_idx"),
         ]
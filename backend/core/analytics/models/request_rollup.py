@@ -0,0 +1,34 @@
+# backend/core/analytics/models/request_rollup.py
+
+from django.db import models
+
+
+class RequestRollup(models.Model):
+    """
+    Request count, error count and latency percentiles of one endpoint over one
+    minute or hour, built from api_requests by `manage.py rollup_api_requests`.
+    """
+
+    MINUTE = "minute"
+    HOUR = "hour"
+
+    resolution = models.CharField(max_length=10, choices=[(MINUTE, "Minute"), (HOUR, "Hour")])
+    bucket = models.DateTimeField()  # start of the minute or hour
+    url_name = models.CharField(max_length=100)
+    request_count = models.PositiveIntegerField(default=0)
+    error_count = models.PositiveIntegerField(default=0)  # 5xx responses
+    p50_ms = models.FloatField(null=True)
+    p95_ms = models.FloatField(null=True)
+    p99_ms = models.FloatField(null=True)
+
+    class Meta:
+        db_table = "api_request_rollups"
+        verbose_name = "request rollup"
+        verbose_name_plural = "request rollups"
+        ordering = ["resolution", "-bucket", "url_name"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["resolution", "url_name", "bucket"], name="unique_request_rollup"
+            )
+        ]
+        indexes = [models.Index(fields=["resolution", "bucket"], name="request_rollup_bucket_idx")]
@@ -0,0 +1,61 @@
+# backend/core/analytics/partitions.py
+
+import logging
+from datetime import datetime, timezone as dt_timezone
+
+from django.db import connection
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+TABLE = "api_requests"
+DEFAULT_PARTITION = f"{TABLE}_default"
+
+
+def month_start(moment):
+    return datetime(moment.year, moment.month, 1, tzinfo=dt_timezone.utc)
+
+
+def next_month(start):
+    return datetime(start.year + start.month // 12, start.month % 12 + 1, 1, tzinfo=dt_timezone.utc)
+
+
+def partition_name(start):
+    return f"{TABLE}_{start:%Y_%m}"
+
+
+def create_partition_sql(start):
+    """DDL for the monthly partition of api_requests beginning at start."""
+    return (
+        f'CREATE TABLE IF NOT EXISTS "{partition_name(start)}" PARTITION OF "{TABLE}" '
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{next_month(start).isoformat()}')"
+    )
+
+
+def ensure_partitions(months_ahead=2):
+    """
+    Create this month's and the next months_ahead monthly partitions, so new
+    rows never land in the default partition. Returns the partitions checked.
+    """
+    start = month_start(timezone.now())
+    names = []
+    with connection.cursor() as cursor:
+        for _ in range(months_ahead + 1):
+            cursor.execute(create_partition_sql(start))
+            names.append(partition_name(start))
+            start = next_month(start)
+    logger.debug(f"Ensured api_requests partitions {names}")
+    return names
+
+
+def default_partition_rows():
+    """
+    Rows that fell through to the default partition because their month had no
+    partition yet. Logged as an error, since they stay there until moved by hand.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(f'SELECT COUNT(*) FROM "{DEFAULT_PARTITION}"')
+        count = cursor.fetchone()[0]
+    if count:
+        logger.error(f"{count} rows are in {DEFAULT_PARTITION}; a monthly partition was missing")
+    return count
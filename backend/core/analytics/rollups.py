@@ -0,0 +1,77 @@
+# backend/core/analytics/rollups.py
+
+import logging
+from datetime import timedelta
+
+from django.db import connection
+from django.db.models import Max
+from django.utils import timezone
+
+from core.analytics.models import RequestRollup
+
+logger = logging.getLogger(__name__)
+
+# Buckets this close to the newest one are recomputed, to pick up rows the
+# request log buffer wrote late
+RECOMPUTE = {
+    RequestRollup.MINUTE: timedelta(minutes=5),
+    RequestRollup.HOUR: timedelta(hours=1),
+}
+
+# Rebuild every (bucket, endpoint) in [start, end) from the raw rows in one statement;
+# partition pruning keeps the scan to the months the window touches
+_ROLLUP_SQL = """
+INSERT INTO api_request_rollups
+    (resolution, bucket, url_name, request_count, error_count, p50_ms, p95_ms, p99_ms)
+SELECT
+    %(resolution)s,
+    date_trunc(%(resolution)s, requested_at) AS bucket,
+    url_name,
+    COUNT(*),
+    COUNT(*) FILTER (WHERE response_status >= 500),
+    percentile_cont(0.5) WITHIN GROUP (ORDER BY latency_ms),
+    percentile_cont(0.95) WITHIN GROUP (ORDER BY latency_ms),
+    percentile_cont(0.99) WITHIN GROUP (ORDER BY latency_ms)
+FROM (
+    SELECT
+        requested_at,
+        url_name,
+        response_status,
+        EXTRACT(EPOCH FROM responded_at - requested_at) * 1000 AS latency_ms
+    FROM api_requests
+    WHERE requested_at >= %(start)s AND requested_at < %(end)s
+) AS raw
+GROUP BY bucket, url_name
+ON CONFLICT (resolution, url_name, bucket) DO UPDATE SET
+    request_count = EXCLUDED.request_count,
+    error_count = EXCLUDED.error_count,
+    p50_ms = EXCLUDED.p50_ms,
+    p95_ms = EXCLUDED.p95_ms,
+    p99_ms = EXCLUDED.p99_ms
+"""
+
+
+def truncate(moment, resolution):
+    moment = moment.replace(second=0, microsecond=0)
+    if resolution == RequestRollup.HOUR:
+        moment = moment.replace(minute=0)
+    return moment
+
+
+def rollup(resolution, backfill=timedelta(hours=24)):
+    """
+    Bring one resolution's rollups up to date. Starts from the newest existing
+    bucket (less the recompute window), or `backfill` ago on the first run.
+    Returns the number of (bucket, endpoint) rows written.
+    """
+    now = timezone.now()
+    rollups = RequestRollup.objects.filter(resolution=resolution)
+    newest = rollups.aggregate(newest=Max("bucket"))["newest"]
+    start = min(newest, now - RECOMPUTE[resolution]) if newest else now - backfill
+    start = truncate(start, resolution)
+
+    with connection.cursor() as cursor:
+        cursor.execute(_ROLLUP_SQL, {"resolution": resolution, "start": start, "end": now})
+        written = cursor.rowcount
+    logger.info(f"Rolled up {written} {resolution} buckets since {start.isoformat()}")
+    return written
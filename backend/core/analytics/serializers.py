@@ -0,0 +1,19 @@
+# backend/core/analytics/serializers.py
+
+from rest_framework import serializers
+from .models import RequestRollup
+
+
+class RequestRollupSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = RequestRollup
+        fields = (
+            "resolution",
+            "bucket",
+            "url_name",
+            "request_count",
+            "error_count",
+            "p50_ms",
+            "p95_ms",
+            "p99_ms",
+        )
@@ -1,3 +1,11 @@
 # backend/core/analytics/urls.py
 
-urlpatterns = []
+from django.urls import path
+
+from .views import EndpointSummaryView, RequestRollupListView, metrics
+
+urlpatterns = [
+    path("metrics/", metrics, name="metrics"),
+    path("rollups/", RequestRollupListView.as_view(), name="request_rollups"),
+    path("endpoints/", EndpointSummaryView.as_view(), name="endpoint_summary"),
+]
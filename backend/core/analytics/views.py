@@ -0,0 +1,125 @@
+# backend/core/analytics/views.py
+
+import hmac
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import F, Max, Sum
+from django.http import HttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework import permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.analytics.metrics import registry
+from .models import RequestRollup
+from .serializers import RequestRollupSerializer
+
+logger = logging.getLogger(__name__)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _authorised(request):
+    """Scrapers present METRICS_TOKEN as a bearer token; staff sessions are also allowed."""
+    header = request.headers.get("Authorization", "")
+    if settings.METRICS_TOKEN and header.startswith("Bearer "):
+        return hmac.compare_digest(header[len("Bearer ") :], settings.METRICS_TOKEN)
+    user = getattr(request, "user", None)
+    return bool(user and user.is_authenticated and user.is_staff)
+
+
+def metrics(request):
+    """
+    GET /api/analytics/metrics/
+    Request, database, Openverse and cache metrics for all workers, in the
+    Prometheus text format.
+    """
+    if not _authorised(request):
+        return HttpResponse("Forbidden\n", status=403, content_type="text/plain")
+    try:
+        body = registry.export()
+    except Exception as e:
+        logger.error(f"Failed to export metrics: {e}")
+        return HttpResponse("Metrics unavailable\n", status=503, content_type="text/plain")
+    return HttpResponse(body, content_type=PROMETHEUS_CONTENT_TYPE)
+
+
+class RequestRollupListView(APIView):
+    """
+    GET /api/analytics/rollups/?resolution=hour&since=<iso>&until=<iso>&url_name=search
+    Per-endpoint request counts, errors and latency percentiles per minute or
+    hour, read from the rollup table only. Defaults to the last 24 hours.
+    """
+
+    permission_classes = [permissions.IsAdminUser]
+    max_rows = 5000
+
+    def get(self, request):
+        resolution = request.GET.get("resolution", RequestRollup.HOUR)
+        if resolution not in (RequestRollup.MINUTE, RequestRollup.HOUR):
+            return Response(
+                {"detail": "resolution must be 'minute' or 'hour'"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            until = parse_datetime(request.GET.get("until", "")) or timezone.now()
+            since = parse_datetime(request.GET.get("since", "")) or until - timedelta(hours=24)
+        except ValueError:
+            return Response(
+                {"detail": "since and until must be valid ISO 8601 datetimes"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        queryset = RequestRollup.objects.filter(
+            resolution=resolution, bucket__gte=since, bucket__lt=until
+        )
+        if request.GET.get("url_name"):
+            queryset = queryset.filter(url_name=request.GET["url_name"])
+
+        rows = queryset.order_by("bucket", "url_name")[: self.max_rows]
+        return Response(RequestRollupSerializer(rows, many=True).data)
+
+
+class EndpointSummaryView(APIView):
+    """
+    GET /api/analytics/endpoints/?hours=24
+    Totals per endpoint over the last N hours from the hourly rollups, busiest
+    first. p95_ms is the worst hourly p95 in the window.
+    """
+
+    permission_classes = [permissions.IsAdminUser]
+    max_hours = 24 * 90
+
+    def get(self, request):
+        try:
+            hours = min(max(int(request.GET.get("hours", 24)), 1), self.max_hours)
+        except ValueError:
+            return Response(
+                {"detail": "hours must be an integer"}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        since = timezone.now() - timedelta(hours=hours)
+        rows = (
+            RequestRollup.objects.filter(resolution=RequestRollup.HOUR, bucket__gte=since)
+            .values("url_name")
+            .annotate(
+                request_count=Sum("request_count"),
+                error_count=Sum("error_count"),
+                p95_ms=Max("p95_ms"),
+            )
+            .order_by(F("request_count").desc(), "url_name")
+        )
+        return Response(
+            [
+                {
+                    **row,
+                    "error_rate": (
+                        row["error_count"] / row["request_count"] if row["request_count"] else 0.0
+                    ),
+                }
+                for row in rows
+            ]
+        )
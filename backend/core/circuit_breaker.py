@@ -0,0 +1,108 @@
+# backend/core/circuit_breaker.py
+
+import logging
+import time
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a call is short-circuited because the breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    A failure-counting circuit breaker whose state lives in the shared cache,
+    so every worker trips and recovers together.
+
+    closed -> open after `failure_threshold` failures within `window` seconds.
+    open -> half-open after `recovery_timeout` seconds; one trial call is let
+    through and its outcome closes or re-opens the breaker.
+    """
+
+    STATE_CACHE_SECONDS = 1.0  # how long a worker trusts its last read of the shared state
+
+    def __init__(self, name, failure_threshold=5, window=30, recovery_timeout=30, trial_timeout=30):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.window = window
+        self.recovery_timeout = recovery_timeout
+        self.trial_timeout = trial_timeout
+
+        self.failures_key = f"circuit:{name}:failures"
+        self.open_key = f"circuit:{name}:open"
+        self.half_open_key = f"circuit:{name}:half_open"
+        self.trial_key = f"circuit:{name}:trial"
+
+        self._local_state = None
+        self._local_state_until = 0.0
+
+    def _remember(self, state):
+        self._local_state = state
+        self._local_state_until = time.monotonic() + self.STATE_CACHE_SECONDS
+
+    def state(self):
+        """Current breaker state, read from the cache at most once per STATE_CACHE_SECONDS."""
+        if self._local_state is not None and time.monotonic() < self._local_state_until:
+            return self._local_state
+
+        flags = cache.get_many([self.open_key, self.half_open_key])
+        if self.open_key in flags:
+            state = OPEN
+        elif self.half_open_key in flags:
+            state = HALF_OPEN
+        else:
+            state = CLOSED
+        self._remember(state)
+        return state
+
+    def before_call(self):
+        """
+        Admit or reject a call. Returns the state the call was admitted in,
+        which must be passed back to record_success/record_failure.
+        """
+        state = self.state()
+        if state == OPEN:
+            raise CircuitOpenError(f"Circuit '{self.name}' is open")
+        if state == HALF_OPEN and not cache.add(self.trial_key, 1, timeout=self.trial_timeout):
+            raise CircuitOpenError(f"Circuit '{self.name}' is half-open, trial call in progress")
+        return state
+
+    def record_success(self, state):
+        """Close the breaker after a successful half-open trial."""
+        if state != HALF_OPEN:
+            return
+        cache.delete_many([self.failures_key, self.half_open_key, self.trial_key])
+        self._remember(CLOSED)
+        logger.info(f"Circuit '{self.name}' closed after a successful trial call")
+
+    def record_failure(self, state):
+        """Count a failure, opening the breaker once the threshold is reached."""
+        if state == HALF_OPEN:
+            self._open()
+            return
+
+        cache.add(self.failures_key, 0, timeout=self.window)
+        try:
+            failures = cache.incr(self.failures_key)
+        except ValueError:
+            # The window expired between add and incr
+            cache.set(self.failures_key, 1, timeout=self.window)
+            failures = 1
+
+        if failures >= self.failure_threshold:
+            self._open()
+
+    def _open(self):
+        cache.set(self.open_key, 1, timeout=self.recovery_timeout)
+        # Outlives the open flag so the first call after recovery is a trial
+        cache.set(self.half_open_key, 1, timeout=self.recovery_timeout + self.window)
+        cache.delete_many([self.failures_key, self.trial_key])
+        self._remember(OPEN)
+        logger.warning(f"Circuit '{self.name}' opened for {self.recovery_timeout}s")
@@ -0,0 +1,24 @@
+# backend/core/http_cache.py
+
+from django.conf import settings
+from django.utils.cache import patch_cache_control, patch_vary_headers
+
+# Responses differ between anonymous and authenticated callers, so shared caches
+# must key on the credentials as well as the URL
+VARY_ON = ("Authorization", "Cookie")
+
+
+def cache_response(response, max_age=None, private=False):
+    """
+    Add Cache-Control/Vary headers to a GET response. Public responses may be
+    stored by a CDN or reverse proxy for max_age seconds; private ones are only
+    kept by the browser and revalidated with the ETag on every use.
+    ConditionalGetMiddleware adds the ETag and answers revalidations with 304.
+    """
+    if private:
+        patch_cache_control(response, private=True, no_cache=True)
+    else:
+        max_age = settings.HTTP_CACHE_MAX_AGE if max_age is None else max_age
+        patch_cache_control(response, public=True, max_age=max_age)
+    patch_vary_headers(response, VARY_ON)
+    return response
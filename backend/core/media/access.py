@@ -0,0 +1,80 @@
+# backend/core/media/access.py
+
+import logging
+import time
+from datetime import datetime, timezone as dt_timezone
+
+from django.db import connection, transaction
+from django_redis import get_redis_connection
+
+logger = logging.getLogger(__name__)
+
+COUNTS_KEY = "media:access:counts"
+LAST_SEEN_KEY = "media:access:last_seen"
+FLUSHING_COUNTS_KEY = "media:access:counts:flushing"
+FLUSHING_LAST_SEEN_KEY = "media:access:last_seen:flushing"
+
+# Swap the live hashes out for flushing, unless a previous flush left some behind
+_CLAIM = """
+if redis.call('EXISTS', KEYS[3]) == 0 and redis.call('EXISTS', KEYS[1]) == 1 then
+    redis.call('RENAME', KEYS[1], KEYS[3])
+    if redis.call('EXISTS', KEYS[2]) == 1 then
+        redis.call('RENAME', KEYS[2], KEYS[4])
+    end
+end
+return redis.call('EXISTS', KEYS[3])
+"""
+
+_UPDATE_SQL = """
+UPDATE media
+SET access_count = media.access_count + v.hits,
+    accessed_at = GREATEST(media.accessed_at, v.seen)
+FROM (VALUES {values}) AS v(openverse_id, hits, seen)
+WHERE media.openverse_id = v.openverse_id
+"""
+
+
+def _redis():
+    return get_redis_connection("default")
+
+
+def record_access(openverse_id):
+    """Count a media detail view in Redis; flush_access() writes it to Media later."""
+    pipe = _redis().pipeline(transaction=False)
+    pipe.hincrby(COUNTS_KEY, openverse_id, 1)
+    pipe.hset(LAST_SEEN_KEY, openverse_id, time.time())
+    pipe.execute()
+
+
+def flush_access(batch_size=1000):
+    """
+    Apply buffered access counts and last-seen times to Media with batched
+    UPDATE ... FROM (VALUES ...) statements. Returns the number of media updated.
+    """
+    conn = _redis()
+    keys = [COUNTS_KEY, LAST_SEEN_KEY, FLUSHING_COUNTS_KEY, FLUSHING_LAST_SEEN_KEY]
+    if not conn.eval(_CLAIM, len(keys), *keys):
+        return 0
+
+    counts = conn.hgetall(FLUSHING_COUNTS_KEY)
+    last_seen = conn.hgetall(FLUSHING_LAST_SEEN_KEY)
+    rows = [
+        (
+            openverse_id.decode(),
+            int(hits),
+            datetime.fromtimestamp(
+                float(last_seen.get(openverse_id, time.time())), dt_timezone.utc
+            ),
+        )
+        for openverse_id, hits in counts.items()
+    ]
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start : start + batch_size]
+            values = ", ".join(["(%s, %s::integer, %s::timestamptz)"] * len(batch))
+            cursor.execute(_UPDATE_SQL.format(values=values), [v for row in batch for v in row])
+
+    conn.delete(FLUSHING_COUNTS_KEY, FLUSHING_LAST_SEEN_KEY)
+    logger.info(f"Flushed access counts for {len(rows)} media items")
+    return len(rows)
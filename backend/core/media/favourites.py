@@ -0,0 +1,90 @@
+# backend/core/media/favourites.py
+
+import logging
+
+from django.db import connection, transaction
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
+
+from core.media.models import Favourite, Media
+
+logger = logging.getLogger(__name__)
+
+# Recompute every drifted counter from one GROUP BY over favourites
+_RECONCILE_SQL = """
+UPDATE media
+SET favourites_count = COALESCE(f.total, 0)
+FROM media AS m
+LEFT JOIN (
+    SELECT media_id, COUNT(*) AS total FROM favourites GROUP BY media_id
+) AS f ON f.media_id = m.id
+WHERE media.id = m.id AND media.favourites_count <> COALESCE(f.total, 0)
+"""
+
+
+def add_favourite(user, media):
+    """Favourite media for user, incrementing the counter only if a row was inserted."""
+    with transaction.atomic():
+        _, created = Favourite.objects.get_or_create(user=user, media=media)
+        if created:
+            Media.objects.filter(pk=media.pk).update(favourites_count=F("favourites_count") + 1)
+    return created
+
+
+def remove_favourite(user, media):
+    """Unfavourite media for user, decrementing the counter only if a row was deleted."""
+    with transaction.atomic():
+        deleted, _ = Favourite.objects.filter(user=user, media=media).delete()
+        if deleted:
+            # Clamped so a drifted counter can't fail the positive-integer check
+            Media.objects.filter(pk=media.pk).update(
+                favourites_count=Greatest(F("favourites_count") - 1, Value(0))
+            )
+    return bool(deleted)
+
+
+def user_favourites(user_id):
+    """
+    A user's favourites with their media, newest first. Rows are found through
+    the covering (user, added_at, id) INCLUDE (media) index; favourites_count
+    is read from the stored counter rather than counted per row.
+    """
+    return (
+        Favourite.objects.filter(user_id=user_id)
+        .select_related("media")
+        .defer("media__search_vector")
+        .order_by("-added_at", "-id")
+    )
+
+
+def favourite_ids(user, openverse_ids):
+    """The subset of openverse_ids that user has favourited, in one query."""
+    return set(
+        Favourite.objects.filter(user=user, media__openverse_id__in=openverse_ids).values_list(
+            "media__openverse_id", flat=True
+        )
+    )
+
+
+def mark_favourites(user, payload):
+    """
+    Copy of a search payload with is_favourite set on every result.
+    The payload itself may be shared through the result cache, so it is not modified.
+    """
+    favourited = favourite_ids(user, [item["openverse_id"] for item in payload["results"]])
+    results = [
+        {**item, "is_favourite": item["openverse_id"] in favourited} for item in payload["results"]
+    ]
+    return {**payload, "results": results}
+
+
+def reconcile_favourites_count():
+    """
+    Reset favourites_count wherever it has drifted from the favourites table,
+    e.g. after user deletions cascade past the counters. Returns rows fixed.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(_RECONCILE_SQL)
+        fixed = cursor.rowcount
+    logger.info(f"Reconciled favourites_count on {fixed} media items")
+    return fixed
@@ -0,0 +1,225 @@
+# backend/core/media/ingest.py
+
+import logging
+from collections import Counter
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from core.media.models import Media, Tag
+from core.media.sources import apply_changes, count_changes, existing_sources
+
+logger = logging.getLogger(__name__)
+
+TAG_ACCURACY_THRESHOLD = 0.5
+
+# Columns refreshed when an incoming item already exists
+UPSERT_FIELDS = [
+    "title",
+    "indexed_on",
+    "foreign_landing_url",
+    "url",
+    "creator",
+    "creator_url",
+    "license",
+    "license_version",
+    "license_url",
+    "attribution",
+    "source",
+    "category",
+    "file_size",
+    "file_type",
+    "mature",
+    "thumbnail_url",
+    "height",
+    "width",
+    "duration",
+    "media_type",
+    "fetched_at",
+]
+
+
+# Rebuild the weighted full-text vector for a set of media ids in one statement
+SEARCH_VECTOR_SQL = """
+UPDATE media
+SET search_vector =
+    setweight(to_tsvector(%(config)s::regconfig, coalesce(media.title, '')), 'A')
+    || setweight(to_tsvector(%(config)s::regconfig, coalesce(media.creator, '')), 'B')
+    || setweight(to_tsvector(%(config)s::regconfig, coalesce(page_tags.names, '')), 'C')
+FROM (
+    SELECT m.id, string_agg(t.name, ' ') AS names
+    FROM media m
+    LEFT JOIN media_tags mt ON mt.media_id = m.id
+    LEFT JOIN tags t ON t.id = mt.tag_id
+    WHERE m.id = ANY(%(ids)s)
+    GROUP BY m.id
+) AS page_tags
+WHERE media.id = page_tags.id
+"""
+
+# Upsert a page of media. inserted is true only for rows this statement created,
+# so two concurrent first-time ingests of an item count it once between them
+UPSERT_MEDIA_SQL = """
+INSERT INTO media ({columns})
+VALUES {values}
+ON CONFLICT (openverse_id) DO UPDATE SET {updates}
+RETURNING id, openverse_id, (xmax = 0) AS inserted
+"""
+
+# Insert a page's MediaTag links, returning the tag of each link that was new
+LINK_TAGS_SQL = """
+INSERT INTO media_tags (media_id, tag_id, accuracy)
+VALUES {values}
+ON CONFLICT (media_id, tag_id) DO NOTHING
+RETURNING tag_id
+"""
+
+# Add to tags.usage_count, locking the tag rows in id order so that concurrent
+# ingests sharing popular tags wait on each other instead of deadlocking
+BUMP_TAG_USAGE_SQL = """
+WITH locked AS (
+    SELECT id FROM tags WHERE id = ANY(%s) ORDER BY id FOR UPDATE
+)
+UPDATE tags
+SET usage_count = tags.usage_count + added.total
+FROM locked
+JOIN (VALUES {values}) AS added (tag_id, total) ON added.tag_id = locked.id
+WHERE tags.id = locked.id
+"""
+
+
+def upsert_media(records):
+    """
+    Upsert flat media dicts with a single INSERT ... ON CONFLICT (openverse_id)
+    DO UPDATE ... RETURNING id, keeping the source summary in step.
+    Returns a dict of openverse_id -> Media pk.
+    """
+    # ON CONFLICT cannot affect the same row twice in one statement, and rows are
+    # written in openverse_id order so overlapping pages lock them in the same order
+    unique = {data["openverse_id"]: data for data in records}
+    unique = {openverse_id: unique[openverse_id] for openverse_id in sorted(unique)}
+    if not unique:
+        return {}
+
+    # Stored source and media_type, for counting items whose upsert moved them
+    before = existing_sources(unique.keys())
+
+    # Every column but the id and search vector, prepared as bulk_create would
+    fields = [
+        field
+        for field in Media._meta.concrete_fields
+        if not field.primary_key and field.name != "search_vector"
+    ]
+    fetched_at = timezone.now()
+    params = []
+    for data in unique.values():
+        obj = Media(**data, fetched_at=fetched_at)
+        params.extend(
+            field.get_db_prep_save(getattr(obj, field.attname), connection) for field in fields
+        )
+
+    quote = connection.ops.quote_name
+    sql = UPSERT_MEDIA_SQL.format(
+        columns=", ".join(quote(field.column) for field in fields),
+        values=", ".join([f"({', '.join(['%s'] * len(fields))})"] * len(unique)),
+        updates=", ".join(
+            f"{quote(column)} = EXCLUDED.{quote(column)}"
+            for column in (Media._meta.get_field(name).column for name in UPSERT_FIELDS)
+        ),
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+
+    inserted = {openverse_id for _, openverse_id, was_inserted in rows if was_inserted}
+    apply_changes(count_changes(before, unique.values(), inserted))
+    logger.debug(f"Upserted {len(rows)} media items ({len(inserted)} new)")
+
+    return {openverse_id: pk for pk, openverse_id, _ in rows}
+
+
+def ingest_tags(media_ids, tagged_items):
+    """
+    Link a page's tags in a constant number of statements: one lookup of the
+    page's tag names, one conflict-ignoring insert of the missing names (plus a
+    lookup of their ids) and one insert of the MediaTag rows. The usage counts
+    of the newly linked tags are bumped once the transaction commits.
+    """
+    max_length = Tag._meta.get_field("name").max_length
+
+    # Keep the best accuracy for each (media, tag) pair on the page
+    links = {}
+    for openverse_id, tags in tagged_items:
+        media_id = media_ids[openverse_id]
+        for tag_dict in tags:
+            name = tag_dict.get("name")
+            accuracy = tag_dict.get("accuracy")
+            # Only keep tags with a defined accuracy >= threshold
+            if (
+                name
+                and len(name) <= max_length
+                and isinstance(accuracy, (int, float))
+                and accuracy >= TAG_ACCURACY_THRESHOLD
+            ):
+                key = (media_id, name)
+                links[key] = max(links.get(key, accuracy), accuracy)
+
+    if not links:
+        return
+
+    # Resolve every tag name on the page, creating the missing ones
+    names = {name for _, name in links}
+    tag_ids = dict(Tag.objects.filter(name__in=names).values_list("name", "id"))
+    missing = names - tag_ids.keys()
+    if missing:
+        Tag.objects.bulk_create([Tag(name=name) for name in sorted(missing)], ignore_conflicts=True)
+        tag_ids.update(Tag.objects.filter(name__in=missing).values_list("name", "id"))
+
+    # Sorted like the media upsert, so concurrent pages take the link locks in one order
+    rows = sorted(
+        (media_id, tag_ids[name], accuracy) for (media_id, name), accuracy in links.items()
+    )
+    values = ", ".join(["(%s, %s, %s::double precision)"] * len(rows))
+    with connection.cursor() as cursor:
+        cursor.execute(LINK_TAGS_SQL.format(values=values), [v for row in rows for v in row])
+        added = Counter(tag_id for (tag_id,) in cursor.fetchall())
+    transaction.on_commit(lambda: bump_tag_usage(added))
+    logger.debug(f"Linked {len(links)} tags ({len(missing)} new)")
+
+
+def bump_tag_usage(added):
+    """Add the tag_id -> count increments to tags.usage_count in one statement."""
+    if not added:
+        return
+    rows = sorted(added.items())
+    values = ", ".join(["(%s::bigint, %s::integer)"] * len(rows))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            BUMP_TAG_USAGE_SQL.format(values=values),
+            [[tag_id for tag_id, _ in rows], *(v for row in rows for v in row)],
+        )
+
+
+def update_search_vectors(media_pks):
+    """Refresh search_vector for the given Media pks from their title, creator and tags."""
+    media_pks = list(media_pks)
+    if not media_pks:
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(SEARCH_VECTOR_SQL, {"config": settings.SEARCH_TEXT_CONFIG, "ids": media_pks})
+
+
+def ingest_page(records, tagged_items):
+    """
+    Persist one page of search results.
+
+    :param records: flat media dicts, as returned to the client
+    :param tagged_items: (openverse_id, raw Openverse tags) pairs
+    :return: dict of openverse_id -> Media pk
+    """
+    with transaction.atomic():
+        media_ids = upsert_media(records)
+        ingest_tags(media_ids, tagged_items)
+        update_search_vectors(media_ids.values())
+    return media_ids
@@ -0,0 +1,109 @@
+# backend/core/media/management/commands/benchmark_favourites.py
+
+import statistics
+import time
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from core.media.favourites import user_favourites
+from core.media.models import Favourite, Media
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        "Time a profile's favourites page as the favourites table grows, against the "
+        "old per-row COUNT join. Runs in a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            default="1000,10000,100000",
+            help="Comma-separated favourites table sizes to measure at.",
+        )
+        parser.add_argument("--media", type=int, default=1000, help="Synthetic media rows.")
+        parser.add_argument("--page-size", type=int, default=24)
+        parser.add_argument("--repeat", type=int, default=20, help="Timed runs per query.")
+
+    def handle(self, *args, **options):
+        sizes = sorted(int(s) for s in options["sizes"].split(","))
+        with transaction.atomic():
+            media = self._create_media(options["media"])
+            user = self._create_users(1)[0]
+            Favourite.objects.bulk_create(
+                [Favourite(user=user, media=m) for m in media[: options["page_size"] * 4]]
+            )
+
+            self.stdout.write(f"{'favourites':>12} {'stored counter ms':>18} {'COUNT join ms':>14}")
+            for size in sizes:
+                self._grow(media, size)
+                stored = self._time(lambda: user_favourites(user.pk), options)
+                joined = self._time(lambda: self._old_queryset(user), options)
+                total = Favourite.objects.count()
+                self.stdout.write(f"{total:>12} {stored:>18.2f} {joined:>14.2f}")
+
+            transaction.set_rollback(True)
+
+    def _create_media(self, count):
+        now = timezone.now()
+        return Media.objects.bulk_create(
+            [
+                Media(
+                    openverse_id=f"benchmark-{uuid.uuid4()}",
+                    title=f"Benchmark media {i}",
+                    indexed_on=now,
+                    foreign_landing_url="https://example.com/",
+                    url="https://example.com/",
+                    license="by",
+                    license_url="https://example.com/",
+                    mature=False,
+                    media_type="image",
+                )
+                for i in range(count)
+            ]
+        )
+
+    def _create_users(self, count):
+        users = []
+        for _ in range(count):
+            name = f"benchmark-{uuid.uuid4().hex[:12]}"
+            user = User(username=name, email=f"{name}@example.com")
+            user.set_unusable_password()
+            users.append(user)
+        return User.objects.bulk_create(users)
+
+    def _grow(self, media, size):
+        """Add filler users who favourite every media item until the table reaches size."""
+        missing = size - Favourite.objects.count()
+        if missing <= 0:
+            return
+        for user in self._create_users(-(-missing // len(media))):
+            Favourite.objects.bulk_create(
+                [Favourite(user=user, media=m) for m in media], batch_size=5000
+            )
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE favourites")
+
+    def _old_queryset(self, user):
+        return (
+            Favourite.objects.filter(user__username=user.username)
+            .select_related("media")
+            .annotate(media__favourites_count=Count("media__favourite"))
+            .order_by("-added_at")
+        )
+
+    def _time(self, make_queryset, options):
+        """Median milliseconds to fetch the first page."""
+        timings = []
+        for _ in range(options["repeat"]):
+            start = time.perf_counter()
+            list(make_queryset()[: options["page_size"]])
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings)
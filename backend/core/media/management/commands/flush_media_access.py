@@ -0,0 +1,45 @@
+# backend/core/media/management/commands/flush_media_access.py
+
+import logging
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from core.media.access import flush_access
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Flush buffered media detail accesses from Redis into Media in batched UPDATEs."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=None,
+            help="Keep running, flushing every INTERVAL seconds (default: flush once).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.MEDIA_ACCESS_FLUSH_BATCH_SIZE,
+            help="Rows per UPDATE statement.",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            close_old_connections()
+            try:
+                flushed = flush_access(options["batch_size"])
+                self.stdout.write(f"Flushed access data for {flushed} media items.")
+            except Exception as e:
+                if options["interval"] is None:
+                    raise
+                logger.error(f"Access flush failed, retrying: {e}")
+
+            if options["interval"] is None:
+                return
+            time.sleep(options["interval"])
@@ -0,0 +1,61 @@
+# backend/core/media/management/commands/ingest_worker.py
+
+import json
+import logging
+import socket
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from core.media.write_behind import drain_batch, queue_stats
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Drain the write-behind search ingestion queue into Media, Tag and MediaTag."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.INGEST_BATCH_SIZE,
+            help="Maximum number of queued pages written per batch.",
+        )
+        parser.add_argument(
+            "--flush-interval",
+            type=float,
+            default=settings.INGEST_FLUSH_INTERVAL,
+            help="Seconds to wait for more pages when a batch comes back short.",
+        )
+        parser.add_argument(
+            "--consumer",
+            default=socket.gethostname(),
+            help="Name of this worker's processing list; keep it stable across restarts.",
+        )
+        parser.add_argument("--once", action="store_true", help="Drain the queue once and exit.")
+        parser.add_argument("--stats", action="store_true", help="Print queue metrics and exit.")
+
+    def handle(self, *args, **options):
+        if options["stats"]:
+            self.stdout.write(json.dumps(queue_stats(), indent=2))
+            return
+
+        batch_size = options["batch_size"]
+        logger.info(f"Ingest worker '{options['consumer']}' started (batch size {batch_size})")
+
+        while True:
+            close_old_connections()
+            try:
+                taken = drain_batch(options["consumer"], batch_size)
+            except Exception as e:
+                logger.error(f"Ingest worker error, retrying: {e}")
+                taken = 0
+
+            if options["once"] and taken == 0:
+                return
+            # Let a short batch fill up before polling again
+            if taken < batch_size and not options["once"]:
+                time.sleep(options["flush_interval"])
@@ -0,0 +1,13 @@
+# backend/core/media/management/commands/rebuild_source_summary.py
+
+from django.core.management.base import BaseCommand
+
+from core.media.sources import rebuild
+
+
+class Command(BaseCommand):
+    help = "Recount the media_sources summary from the media table."
+
+    def handle(self, *args, **options):
+        rows = rebuild()
+        self.stdout.write(f"Rebuilt source summary with {rows} (source, media_type) rows.")
@@ -0,0 +1,13 @@
+# backend/core/media/management/commands/reconcile_favourites_count.py
+
+from django.core.management.base import BaseCommand
+
+from core.media.favourites import reconcile_favourites_count
+
+
+class Command(BaseCommand):
+    help = "Recompute drifted Media.favourites_count values from the favourites table."
+
+    def handle(self, *args, **options):
+        fixed = reconcile_favourites_count()
+        self.stdout.write(f"Reconciled favourites_count on {fixed} media items.")
@@ -0,0 +1,43 @@
+# backend/core/media/management/commands/refresh_media.py
+
+import logging
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from core.media.refresh import refresh_batch
+from core.openverse_client import OpenverseClient
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Refresh stale media queued by the detail view from Openverse."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=None,
+            help="Keep running, polling the queue every INTERVAL seconds (default: drain once).",
+        )
+        parser.add_argument("--batch-size", type=int, default=50, help="Items refreshed per batch.")
+
+    def handle(self, *args, **options):
+        client = OpenverseClient()
+        while True:
+            close_old_connections()
+            try:
+                refreshed = refresh_batch(client, options["batch_size"])
+            except Exception as e:
+                if options["interval"] is None:
+                    raise
+                logger.error(f"Media refresh failed, retrying: {e}")
+                refreshed = 0
+
+            if refreshed:
+                continue  # keep draining while there is work
+            if options["interval"] is None:
+                return
+            time.sleep(options["interval"])
@@ -0,0 +1,42 @@
+# Generated by Django 5.1.7 on 2026-10-18 13:29
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def merge_duplicate_tags(apps, schema_editor):
+    """Fold duplicate tag names into the oldest row before adding the constraint."""
+    Tag = apps.get_model("media", "Tag")
+    MediaTag = apps.get_model("media", "MediaTag")
+
+    duplicates = (
+        Tag.objects.values("name").annotate(n=Count("id"), keep=Min("id")).filter(n__gt=1)
+    )
+    for row in duplicates:
+        others = Tag.objects.filter(name=row["name"]).exclude(id=row["keep"])
+        for tag in others:
+            # Drop links the kept tag already has, then repoint the rest
+            kept_media = MediaTag.objects.filter(tag_id=row["keep"]).values("media_id")
+            MediaTag.objects.filter(tag=tag, media_id__in=kept_media).delete()
+            MediaTag.objects.filter(tag=tag).update(tag_id=row["keep"])
+        others.delete()
+
+    # Fire the deferred media_tags FK checks now; Postgres refuses to ALTER
+    # tags below while trigger events are still pending
+    schema_editor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("media", "0010_alter_media_creator"),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_tags, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="tag",
+            name="name",
+            field=models.CharField(max_length=100, unique=True),
+        ),
+    ]
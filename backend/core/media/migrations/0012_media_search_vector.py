@@ -0,0 +1,49 @@
+# Generated by Django 5.1.7 on 2026-10-18 13:35
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+BACKFILL_SEARCH_VECTOR = """
+UPDATE media
+SET search_vector =
+    setweight(to_tsvector(%(config)s::regconfig, coalesce(media.title, '')), 'A')
+    || setweight(to_tsvector(%(config)s::regconfig, coalesce(media.creator, '')), 'B')
+    || setweight(to_tsvector(%(config)s::regconfig, coalesce(page_tags.names, '')), 'C')
+FROM (
+    SELECT m.id, string_agg(t.name, ' ') AS names
+    FROM media m
+    LEFT JOIN media_tags mt ON mt.media_id = m.id
+    LEFT JOIN tags t ON t.id = mt.tag_id
+    GROUP BY m.id
+) AS page_tags
+WHERE media.id = page_tags.id
+"""
+
+
+def backfill_search_vector(apps, schema_editor):
+    # Same text search configuration as the ingest path and search queries use
+    schema_editor.execute(BACKFILL_SEARCH_VECTOR, {"config": settings.SEARCH_TEXT_CONFIG})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("media", "0011_tag_name_unique"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="media",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(backfill_search_vector, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="media",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="media_search_vector_idx"
+            ),
+        ),
+    ]
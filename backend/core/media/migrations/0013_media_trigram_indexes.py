@@ -0,0 +1,28 @@
+# Generated by Django 5.1.7 on 2026-10-18 13:35
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("media", "0012_media_search_vector"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="media",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["title"], name="media_title_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="media",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["creator"], name="media_creator_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+    ]
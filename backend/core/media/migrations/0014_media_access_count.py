@@ -0,0 +1,18 @@
+# Generated by Django 5.1.7 on 2026-10-18 13:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("media", "0013_media_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="media",
+            name="access_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
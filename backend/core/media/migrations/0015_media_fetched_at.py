@@ -0,0 +1,26 @@
+# Generated by Django 5.1.7 on 2026-10-18 13:36
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("media", "0014_media_access_count"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="media",
+            name="fetched_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        # accessed_at was bumped by every save, so it is the best record of the last fetch
+        migrations.RunSQL("UPDATE media SET fetched_at = accessed_at", migrations.RunSQL.noop),
+        migrations.AlterField(
+            model_name="media",
+            name="accessed_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
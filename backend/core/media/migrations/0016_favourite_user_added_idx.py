@@ -0,0 +1,19 @@
+# Generated by Django 5.1.7 on 2026-10-18 13:39
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("media", "0015_media_fetched_at"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="favourite",
+            index=models.Index(fields=["user", "added_at", "id"], name="favourite_user_added_idx"),
+        ),
+    ]
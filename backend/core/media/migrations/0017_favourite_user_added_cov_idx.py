@@ -0,0 +1,24 @@
+# Generated by Django 5.1.7 on 2026-10-18 13:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("media", "0016_favourite_user_added_idx"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="favourite",
+            index=models.Index(fields=["user", "added_at", "id"], include=("media",), name="favourite_user_added_cov_idx"),
+        ),
+        # Dropped after the covering index exists, so listings are never unindexed
+        migrations.RemoveIndex(
+            model_name="favourite",
+            name="favourite_user_added_idx",
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.1.7 on 2026-10-18 13:42
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("media", "0017_favourite_user_added_cov_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="tag",
+            name="usage_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunSQL(
+            """
+            UPDATE tags SET usage_count = counts.total
+            FROM (SELECT tag_id, COUNT(*) AS total FROM media_tags GROUP BY tag_id) AS counts
+            WHERE tags.id = counts.tag_id
+            """,
+            migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name="tag",
+            index=models.Index(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper("name"), name="text_pattern_ops"), name="tag_name_upper_prefix_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="tag",
+            index=models.Index(fields=["-usage_count", "name"], name="tag_usage_idx"),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.1.7 on 2026-10-18 13:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("media", "0018_tag_usage_count"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SourceSummary",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("source", models.CharField(max_length=100)),
+                ("media_type", models.CharField(max_length=10)),
+                ("media_count", models.IntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "source summary",
+                "verbose_name_plural": "source summaries",
+                "db_table": "media_sources",
+                "ordering": ["source", "media_type"],
+                "constraints": [models.UniqueConstraint(fields=("source", "media_type"), name="unique_source_media_type")],
+            },
+        ),
+        migrations.RunSQL(
+            """
+            INSERT INTO media_sources (source, media_type, media_count)
+            SELECT source, media_type, COUNT(*) FROM media
+            WHERE source IS NOT NULL
+            GROUP BY source, media_type
+            """,
+            migrations.RunSQL.noop,
+        ),
+    ]
@@ -3,3 +3,4 @@
 from .media import Media
 from .tag import Tag, MediaTag
 from .favourite import Favourite
+from .source import SourceSummary
@@ -15,3 +15,12 @@ class Favourite(models.Model):
         verbose_name_plural = "favourites"
         ordering = ["-added_at"]
         constraints = [models.UniqueConstraint(fields=["user", "media"], name="unique_favourite")]
+        indexes = [
+            # Keyset pagination of a user's favourites on (added_at, id); covers
+            # media_id so a page is read from the index alone before the Media join
+            models.Index(
+                fields=["user", "added_at", "id"],
+                include=["media"],
+                name="favourite_user_added_cov_idx",
+            ),
+        ]
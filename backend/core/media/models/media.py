@@ -1,6 +1,9 @@
 # backend/core/media/models/media.py
 
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.utils import timezone
 
 
 class Media(models.Model):
@@ -31,8 +34,14 @@ class Media(models.Model):
             ("audio", "Audio"),
         ],
     )
-    accessed_at = models.DateTimeField(auto_now=True)
+    # Last detail view (flushed from Redis), and last time the row came from Openverse
+    accessed_at = models.DateTimeField(default=timezone.now)
+    fetched_at = models.DateTimeField(default=timezone.now)
     favourites_count = models.PositiveIntegerField(default=0)
+    # Detail page views, flushed in batches from Redis by core.media.access
+    access_count = models.PositiveIntegerField(default=0)
+    # Weighted title (A), creator (B) and tag names (C); maintained by core.media.ingest
+    search_vector = SearchVectorField(null=True, editable=False)
 
     class Meta:
         db_table = "media"
@@ -41,4 +50,8 @@ class Media(models.Model):
         ordering = ["-indexed_on"]
         indexes = [
             models.Index(fields=["title"], name="media_title_idx"),
+            # Trigram indexes for fuzzy matching and typeahead alongside the B-tree above
+            GinIndex(fields=["title"], name="media_title_trgm_idx", opclasses=["gin_trgm_ops"]),
+            GinIndex(fields=["creator"], name="media_creator_trgm_idx", opclasses=["gin_trgm_ops"]),
+            GinIndex(fields=["search_vector"], name="media_search_vector_idx"),
         ]
@@ -0,0 +1,29 @@
+# backend/core/media/models/source.py
+
+from django.db import models
+
+
+class SourceSummary(models.Model):
+    """
+    Number of stored media per (source, media_type), so the source filter never
+    scans the media table. Maintained incrementally by core.media.sources.
+    """
+
+    source = models.CharField(max_length=100)
+    media_type = models.CharField(max_length=10)
+    # Signed so a delta can be upserted in one statement; clamped at 0 on update
+    media_count = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.source} ({self.media_type})"
+
+    class Meta:
+        db_table = "media_sources"
+        verbose_name = "source summary"
+        verbose_name_plural = "source summaries"
+        ordering = ["source", "media_type"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["source", "media_type"], name="unique_source_media_type"
+            )
+        ]
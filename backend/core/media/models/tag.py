@@ -1,10 +1,14 @@
 # backend/core/media/models/tag.py
 
+from django.contrib.postgres.indexes import OpClass
 from django.db import models
+from django.db.models.functions import Upper
 
 
 class Tag(models.Model):
-    name = models.CharField(max_length=100)
+    name = models.CharField(max_length=100, unique=True)
+    # Number of media carrying the tag; maintained by core.media.ingest
+    usage_count = models.PositiveIntegerField(default=0)
 
     def __str__(self):
         return self.name
@@ -13,6 +17,13 @@ class Tag(models.Model):
         db_table = "tags"
         verbose_name = "tag"
         verbose_name_plural = "tags"
+        indexes = [
+            # Case-insensitive prefix lookups (name__istartswith) for autocomplete
+            models.Index(
+                OpClass(Upper("name"), name="text_pattern_ops"), name="tag_name_upper_prefix_idx"
+            ),
+            models.Index(fields=["-usage_count", "name"], name="tag_usage_idx"),
+        ]
 
 
 class MediaTag(models.Model):
@@ -0,0 +1,106 @@
+# backend/core/media/refresh.py
+
+import logging
+from datetime import timedelta
+
+from django.utils import timezone
+from django_redis import get_redis_connection
+
+from core.circuit_breaker import CircuitOpenError
+from core.media.ingest import ingest_page
+from core.media.models import Media
+from core.openverse_client import OpenverseError
+from core.search.services import normalise_item
+
+logger = logging.getLogger(__name__)
+
+# A Redis set, so repeated views of the same stale item queue it only once
+QUEUE_KEY = "media:refresh:queue"
+
+STALE_AFTER = timedelta(days=7)
+
+
+def _redis():
+    return get_redis_connection("default")
+
+
+def is_stale(media):
+    """Whether the row was last fetched from Openverse too long ago."""
+    return timezone.now() - media.fetched_at > STALE_AFTER
+
+
+def endpoint_for(media):
+    """Openverse detail path for a stored media item."""
+    endpoint = "images" if media.media_type == "image" else "audio"
+    return f"{endpoint}/{media.openverse_id}"
+
+
+def fresh_item(media, detail):
+    """
+    Raw Openverse item for a detail response, with the keys normalise_item()
+    needs filled from the stored row when the response leaves them out.
+    """
+    return {
+        "id": media.openverse_id,
+        "media_type": media.media_type,
+        "mature": media.mature,
+        **detail,
+    }
+
+
+def fetch_missing(client, openverse_id):
+    """
+    Fetch an item that is not stored yet, e.g. a search result still waiting in
+    the write-behind queue, and ingest it inline. Returns the Media row, or None
+    when Openverse has no image or audio item with that id.
+    """
+    for media_type, endpoint in (("image", "images"), ("audio", "audio")):
+        try:
+            detail = client.query(f"{endpoint}/{openverse_id}")
+        except OpenverseError as e:
+            if e.status_code == 404:
+                continue
+            raise
+        item = {"id": openverse_id, "media_type": media_type, "mature": False, **detail}
+        media_ids = ingest_page([normalise_item(item)], [(openverse_id, item.get("tags") or [])])
+        return Media.objects.get(pk=media_ids[openverse_id])
+    return None
+
+
+def enqueue_refresh(openverse_id):
+    """Queue a stale media item for refresh. Returns False if it was already queued."""
+    return bool(_redis().sadd(QUEUE_KEY, openverse_id))
+
+
+def refresh_batch(client, batch_size=50):
+    """
+    Refresh up to batch_size queued items from Openverse.
+    If the circuit breaker opens, the untouched items are put back on the queue.
+    Returns the number of rows refreshed.
+    """
+    conn = _redis()
+    openverse_ids = [i.decode() for i in conn.spop(QUEUE_KEY, batch_size) or []]
+    if not openverse_ids:
+        return 0
+
+    pending = {m.openverse_id: m for m in Media.objects.filter(openverse_id__in=openverse_ids)}
+    items = []
+    for openverse_id, media in list(pending.items()):
+        try:
+            items.append(fresh_item(media, client.query(endpoint_for(media))))
+        except CircuitOpenError:
+            conn.sadd(QUEUE_KEY, *pending)
+            logger.warning(f"Openverse unavailable, requeued {len(pending)} media refreshes")
+            break
+        except Exception as e:
+            # Dropped; the next view of a still-stale row queues it again
+            logger.error(f"Failed to refresh media {openverse_id}: {e}")
+        del pending[openverse_id]
+
+    # Same write path as search results: upsert, tags, search vectors and source counts
+    ingest_page(
+        [normalise_item(item) for item in items],
+        [(item["id"], item.get("tags") or []) for item in items],
+    )
+    logger.info(f"Refreshed {len(items)} stale media items")
+    return len(items)
@@ -4,7 +4,7 @@ from rest_framework import serializers
 from core.media.models import Media, Favourite
 
 class MediaSerializer(serializers.ModelSerializer):
-    # Annotated field for the number of favourites
+    # Denormalised counter maintained by core.media.favourites
     favourites_count = serializers.IntegerField(read_only=True)
     
     class Meta:
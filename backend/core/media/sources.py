@@ -0,0 +1,123 @@
+# backend/core/media/sources.py
+
+import logging
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+
+from core.analytics.metrics import count_cache
+from core.media.models import Media, SourceSummary
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY = "media:sources"
+
+# Add signed deltas to the per-(source, media_type) counters
+_APPLY_DELTAS_SQL = """
+INSERT INTO media_sources (source, media_type, media_count)
+VALUES {values}
+ON CONFLICT (source, media_type)
+DO UPDATE SET media_count = GREATEST(media_sources.media_count + EXCLUDED.media_count, 0)
+"""
+
+_REBUILD_SQL = """
+INSERT INTO media_sources (source, media_type, media_count)
+SELECT source, media_type, COUNT(*) FROM media
+WHERE source IS NOT NULL
+GROUP BY source, media_type
+"""
+
+
+def existing_sources(openverse_ids):
+    """(source, media_type) currently stored for each of openverse_ids, in one query."""
+    return {
+        openverse_id: (source, media_type)
+        for openverse_id, source, media_type in Media.objects.filter(
+            openverse_id__in=openverse_ids
+        ).values_list("openverse_id", "source", "media_type")
+    }
+
+
+def count_changes(before, records, inserted):
+    """
+    Counter deltas for upserted records: +1 for each item the upsert inserted,
+    and -1/+1 for an updated item whose source or media_type changed from
+    before. An item another transaction inserted after before was read is left
+    to that transaction's count.
+    """
+    deltas = Counter()
+    for data in records:
+        new = (data.get("source"), data.get("media_type"))
+        if data["openverse_id"] in inserted:
+            old = None
+        else:
+            old = before.get(data["openverse_id"], new)
+        if old == new:
+            continue
+        if old is not None and old[0]:
+            deltas[old] -= 1
+        if new[0]:
+            deltas[new] += 1
+    return {key: delta for key, delta in deltas.items() if delta}
+
+
+def apply_changes(deltas):
+    """
+    Add the deltas to SourceSummary with one upsert, once the surrounding
+    transaction commits. The counter rows are hot, so they are locked only for
+    that one statement and always in key order, keeping concurrent ingests
+    from deadlocking on each other.
+    """
+    if not deltas:
+        return
+    transaction.on_commit(lambda: _upsert_deltas(deltas))
+
+
+def _upsert_deltas(deltas):
+    rows = sorted(deltas.items())
+    values = ", ".join(["(%s, %s, %s)"] * len(rows))
+    params = [v for (source, media_type), delta in rows for v in (source, media_type, delta)]
+    with connection.cursor() as cursor:
+        cursor.execute(_APPLY_DELTAS_SQL.format(values=values), params)
+
+
+def rebuild():
+    """Recount SourceSummary from the media table, e.g. after media were deleted."""
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute("DELETE FROM media_sources")
+        cursor.execute(_REBUILD_SQL)
+    cache.delete(CACHE_KEY)
+    return SourceSummary.objects.count()
+
+
+def source_summary():
+    """
+    Sources with their total and per-media-type counts, sorted by name.
+    Reads the small summary table, cached for SOURCE_LIST_CACHE_TTL seconds.
+    """
+    try:
+        summary = cache.get(CACHE_KEY)
+    except Exception as e:
+        logger.warning(f"Source list cache unavailable: {e}")
+        summary = None
+    if summary is not None:
+        count_cache("sources", "hit")
+        return summary
+    count_cache("sources", "miss")
+
+    by_source = {}
+    for row in SourceSummary.objects.filter(media_count__gt=0).order_by("source", "media_type"):
+        entry = by_source.setdefault(
+            row.source, {"source": row.source, "count": 0, "media_types": {}}
+        )
+        entry["count"] += row.media_count
+        entry["media_types"][row.media_type] = row.media_count
+    summary = list(by_source.values())
+
+    try:
+        cache.set(CACHE_KEY, summary, timeout=settings.SOURCE_LIST_CACHE_TTL)
+    except Exception as e:
+        logger.warning(f"Failed to cache source list: {e}")
+    return summary
@@ -0,0 +1,48 @@
+# backend/core/media/tags.py
+
+import hashlib
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+
+from core.analytics.metrics import count_cache
+from core.media.models import Tag
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = "tags:prefix:"
+
+
+def _cache_key(prefix, limit):
+    digest = hashlib.sha1(prefix.casefold().encode()).hexdigest()
+    return f"{CACHE_KEY_PREFIX}{limit}:{digest}"
+
+
+def autocomplete(prefix, limit=20):
+    """
+    Tag names starting with prefix (case-insensitive), most used first.
+    Served from the Upper(name) text_pattern_ops index and cached per prefix.
+    """
+    prefix = prefix.strip()
+    key = _cache_key(prefix, limit)
+    try:
+        names = cache.get(key)
+    except Exception as e:
+        logger.warning(f"Tag autocomplete cache unavailable: {e}")
+        names = None
+    if names is not None:
+        count_cache("tags", "hit")
+        return names
+    count_cache("tags", "miss")
+
+    queryset = Tag.objects.all()
+    if prefix:
+        queryset = queryset.filter(name__istartswith=prefix)
+    names = list(queryset.order_by("-usage_count", "name").values_list("name", flat=True)[:limit])
+
+    try:
+        cache.set(key, names, timeout=settings.TAG_AUTOCOMPLETE_CACHE_TTL)
+    except Exception as e:
+        logger.warning(f"Failed to cache tag autocomplete for '{prefix}': {e}")
+    return names
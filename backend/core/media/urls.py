@@ -1,10 +1,21 @@
 # backend/core/media/urls.py
 
+from django.conf import settings
 from django.urls import path
-from .views import MediaDetailView, MediaFavouriteView, TagListView, SourceListView
+from .views import (
+    AsyncMediaDetailView,
+    FavouriteStatusView,
+    MediaDetailView,
+    MediaFavouriteView,
+    TagListView,
+    SourceListView,
+)
+
+DetailView = AsyncMediaDetailView if settings.ASYNC_VIEWS else MediaDetailView
 
 urlpatterns = [
-    path("<str:openverse_id>/", MediaDetailView.as_view(), name="media_detail"),
+    path("favourites/status/", FavouriteStatusView.as_view(), name="favourite_status"),
+    path("<str:openverse_id>/", DetailView.as_view(), name="media_detail"),
     path("<str:openverse_id>/favourite/", MediaFavouriteView.as_view(), name="media_favourite"),
     path("filters/tags/", TagListView.as_view(), name="tag_list"),
     path("filters/sources/", SourceListView.as_view(), name="source_list"),
@@ -1,88 +1,144 @@
 # backend/core/media/views.py
 
+import logging
+
+from asgiref.sync import sync_to_async
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from django.conf import settings
 from django.shortcuts import get_object_or_404
-from django.http import JsonResponse
-from django.utils import timezone
+from django.http import Http404, JsonResponse
+from django.utils.http import http_date
 from django.views import View
 
+from core.http_cache import cache_response
+from core.media.access import record_access
+from core.media.favourites import add_favourite, favourite_ids, remove_favourite
+from core.media.refresh import enqueue_refresh, fetch_missing, is_stale
 from core.media.models import Media, Favourite
-from core.media.models.tag import Tag
+from core.media.sources import source_summary
+from core.media.tags import autocomplete
 from core.openverse_client import OpenverseClient
 
+logger = logging.getLogger(__name__)
 
-class MediaDetailView(View):
-    client = OpenverseClient()
 
-    def get(self, request, openverse_id):
-        # Fetch the media object from the database (or 404 if not found)
-        media = get_object_or_404(Media, openverse_id=openverse_id)
+def get_media_or_404(openverse_id):
+    """
+    Stored media row for openverse_id. In write-behind mode a search result can
+    link here before the ingest worker has written it, so a miss is fetched
+    from Openverse and written inline instead of answering 404.
+    """
+    try:
+        return Media.objects.get(openverse_id=openverse_id)
+    except Media.DoesNotExist:
+        if settings.SEARCH_INGEST_MODE != "write_behind":
+            raise Http404("No Media matches the given query.")
+
+    try:
+        media = fetch_missing(OpenverseClient(), openverse_id)
+    except Exception as e:
+        logger.warning(f"Failed to fetch missing media {openverse_id} from Openverse: {e}")
+        media = None
+    if media is None:
+        raise Http404("No Media matches the given query.")
+    logger.info(f"Ingested media {openverse_id} ahead of the write-behind queue")
+    return media
+
+
+def _queue_refresh(media):
+    """Queue a stale row for background refresh; the stored row is served meanwhile."""
+    try:
+        if enqueue_refresh(media.openverse_id):
+            logger.info(f"Queued stale media {media.openverse_id} for refresh")
+    except Exception as e:
+        logger.warning(f"Failed to queue refresh for {media.openverse_id}: {e}")
+
+
+def _record_access(media):
+    """Buffer this view in Redis; accessed_at catches up when the buffer is flushed."""
+    try:
+        record_access(media.openverse_id)
+    except Exception as e:
+        logger.warning(f"Failed to record access for {media.openverse_id}: {e}")
+
+
+def _track_view(media):
+    """Handle a detail view without writing the row or waiting on Openverse."""
+    # Refresh in the background if the media was fetched more than 7 days ago
+    if is_stale(media):
+        _queue_refresh(media)
 
-        # Re-query if the media was last accessed more than 7 days ago
-        if (timezone.now() - media.accessed_at).days > 7:
-            endpoint = "images" if media.media_type == "image" else "audio"
-            fresh = self.client.query(f"{endpoint}/{openverse_id}")
-
-            # Update the media object with fresh data
-            updated = {
-                "title": fresh.get("title", media.title),
-                "indexed_on": fresh.get("date_created") or media.indexed_on,
-                "foreign_landing_url": fresh.get("foreign_landing_url", media.foreign_landing_url),
-                "url": fresh.get("url", media.url),
-                "creator": fresh.get("creator", media.creator),
-                "creator_url": fresh.get("creator_url", media.creator_url),
-                "license": fresh.get("license", media.license),
-                "license_version": fresh.get("license_version", media.license_version),
-                "license_url": fresh.get("license_url", media.license_url),
-                "attribution": fresh.get("attribution", media.attribution),
-                "source": fresh.get("source", media.source),
-                "category": fresh.get("category", media.category),
-                "file_size": fresh.get("file_size", media.file_size),
-                "file_type": fresh.get("file_type", media.file_type),
-                "mature": fresh.get("mature", media.mature),
-                "thumbnail_url": fresh.get("thumbnail", media.thumbnail_url),
-                "height": fresh.get("height", media.height),
-                "width": fresh.get("width", media.width),
-                "duration": fresh.get("duration", media.duration),
-            }
-
-            # Update the media object with the new values
-            for field, val in updated.items():
-                setattr(media, field, val)
-
-        media.accessed_at = timezone.now()  # Explicit bump
-        media.save()  # Save the updated media object
+    # Accesses are buffered in Redis instead of updating the row on every view
+    _record_access(media)
+
+
+def _media_payload(media):
+    """Build the media detail JSON body."""
+    return {
+        "openverse_id": media.openverse_id,
+        "title": media.title,
+        "indexed_on": media.indexed_on.isoformat(),
+        "foreign_landing_url": media.foreign_landing_url,
+        "url": media.url,
+        "creator": media.creator,
+        "creator_url": media.creator_url,
+        "license": media.license,
+        "license_version": media.license_version,
+        "license_url": media.license_url,
+        "attribution": media.attribution,
+        "source": media.source,
+        "category": media.category,
+        "file_size": media.file_size,
+        "file_type": media.file_type,
+        "mature": media.mature,
+        "thumbnail_url": media.thumbnail_url,
+        "height": media.height,
+        "width": media.width,
+        "duration": media.duration,
+        "media_type": media.media_type,
+        "accessed_at": media.accessed_at.isoformat(),
+        "fetched_at": media.fetched_at.isoformat(),
+        "favourites_count": media.favourites_count,
+        "access_count": media.access_count,
+    }
+
+
+def _detail_response(media):
+    """
+    Media detail JSON with HTTP validators. The body only reflects stored
+    columns, so its ETag is stable until the row changes; Last-Modified is the
+    later of the last upstream fetch and the last flushed access.
+    """
+    response = JsonResponse(_media_payload(media))
+    response["Last-Modified"] = http_date(max(media.fetched_at, media.accessed_at).timestamp())
+    return cache_response(response)
+
+
+class MediaDetailView(View):
+    def get(self, request, openverse_id):
+        # Fetch the media object from the database (or Openverse, or 404 if not found)
+        media = get_media_or_404(openverse_id)
+        _track_view(media)
 
         # Return the media details as a JSON response
-        return JsonResponse(
-            {
-                "openverse_id": media.openverse_id,
-                "title": media.title,
-                "indexed_on": media.indexed_on.isoformat(),
-                "foreign_landing_url": media.foreign_landing_url,
-                "url": media.url,
-                "creator": media.creator,
-                "creator_url": media.creator_url,
-                "license": media.license,
-                "license_version": media.license_version,
-                "license_url": media.license_url,
-                "attribution": media.attribution,
-                "source": media.source,
-                "category": media.category,
-                "file_size": media.file_size,
-                "file_type": media.file_type,
-                "mature": media.mature,
-                "thumbnail_url": media.thumbnail_url,
-                "height": media.height,
-                "width": media.width,
-                "duration": media.duration,
-                "media_type": media.media_type,
-                "accessed_at": media.accessed_at.isoformat(),
-                "favourites_count": media.favourites_count,
-            }
-        )
+        return _detail_response(media)
+
+
+class AsyncMediaDetailView(View):
+    """
+    Async version of MediaDetailView served under the ASGI profile.
+    """
+
+    async def get(self, request, openverse_id):
+        try:
+            media = await Media.objects.aget(openverse_id=openverse_id)
+        except Media.DoesNotExist:
+            media = await sync_to_async(get_media_or_404)(openverse_id)
+        await sync_to_async(_track_view)(media)
+
+        return _detail_response(media)
 
 class MediaFavouriteView(APIView):
     """
@@ -104,12 +160,8 @@ class MediaFavouriteView(APIView):
         if not request.user or not request.user.is_authenticated:
             return Response({"error": "Authentication required"}, status=status.HTTP_401_UNAUTHORIZED)
         
-        media = get_object_or_404(Media, openverse_id=openverse_id)
-        Favourite.objects.get_or_create(user=request.user, media=media)
-        
-        # Update favourite count
-        media.favourites_count = Favourite.objects.filter(media=media).count()
-        media.save(update_fields=['favourites_count'])
+        media = get_media_or_404(openverse_id)
+        add_favourite(request.user, media)
         
         return Response({"is_favourite": True}, status=status.HTTP_201_CREATED)
         
@@ -118,26 +170,68 @@ class MediaFavouriteView(APIView):
             return Response({"error": "Authentication required"}, status=status.HTTP_401_UNAUTHORIZED)
         
         media = get_object_or_404(Media, openverse_id=openverse_id)
-        Favourite.objects.filter(user=request.user, media=media).delete()
-        
-        # Update favourite count
-        media.favourites_count = Favourite.objects.filter(media=media).count()
-        media.save(update_fields=['favourites_count'])
+        remove_favourite(request.user, media)
         
         return Response({"is_favourite": False}, status=status.HTTP_200_OK)
 
+
+class FavouriteStatusView(APIView):
+    """
+    :GET /api/media/favourites/status/?ids=a,b,c => { a: bool, b: bool, c: bool }
+    Favourite status for a whole results grid in a single query.
+    """
+
+    max_ids = 100
+
+    def get(self, request):
+        ids = []
+        for value in request.GET.getlist("ids"):
+            ids.extend(i.strip() for i in value.split(",") if i.strip())
+        ids = list(dict.fromkeys(ids))  # de-duplicate, keeping order
+
+        if len(ids) > self.max_ids:
+            return Response(
+                {"error": f"At most {self.max_ids} ids per request"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # Anonymous > always false
+        favourited = set()
+        if request.user and request.user.is_authenticated and ids:
+            favourited = favourite_ids(request.user, ids)
+
+        response = Response({i: i in favourited for i in ids}, status=status.HTTP_200_OK)
+        return cache_response(response, private=True)
+
 class TagListView(APIView):
+    """
+    :GET /api/media/filters/tags/?q=nat&limit=20 => ["nature", "national park", ...]
+    Tag names starting with q, most used first. Without q, the most used tags.
+    """
+
+    default_limit = 20
+    max_limit = 50
+
     def get(self, request):
-        names = Tag.objects.values_list('name', flat=True).distinct().order_by('name')
-        return Response(names)
+        try:
+            limit = int(request.GET.get('limit', self.default_limit))
+        except ValueError:
+            limit = self.default_limit
+        limit = min(max(limit, 1), self.max_limit)
+
+        names = autocomplete(request.GET.get('q', ''), limit)
+        return cache_response(Response(names), max_age=settings.HTTP_CACHE_LIST_MAX_AGE)
 
 class SourceListView(APIView):
+    """
+    :GET /api/media/filters/sources/ => ["flickr", "wikimedia", ...]
+    :GET /api/media/filters/sources/?counts=true => [{ source, count, media_types: { image: n } }]
+    """
+
     def get(self, request):
-        sources = (
-            Media.objects
-            .exclude(source__isnull=True)
-            .values_list('source', flat=True)
-            .distinct()
-            .order_by('source')
-        )
-        return Response(sources)
+        summary = source_summary()
+        if request.GET.get('counts', '').lower() in ('1', 'true'):
+            data = summary
+        else:
+            data = [entry['source'] for entry in summary]
+        return cache_response(Response(data), max_age=settings.HTTP_CACHE_LIST_MAX_AGE)
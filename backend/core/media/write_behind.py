@@ -0,0 +1,124 @@
+# backend/core/media/write_behind.py
+
+import json
+import logging
+import time
+
+from django.conf import settings
+from django.db import InterfaceError, OperationalError
+from django_redis import get_redis_connection
+
+from core.media.ingest import ingest_page
+
+logger = logging.getLogger(__name__)
+
+QUEUE_KEY = "ingest:queue"
+PROCESSING_KEY_PREFIX = "ingest:processing:"
+DEAD_LETTER_KEY = "ingest:dead"
+STATS_KEY = "ingest:stats"
+
+# Atomically move up to ARGV[1] pages from the queue onto the consumer's processing list
+_TAKE_BATCH = """
+local items = redis.call('LRANGE', KEYS[1], 0, tonumber(ARGV[1]) - 1)
+if #items > 0 then
+    redis.call('LTRIM', KEYS[1], #items, -1)
+    redis.call('RPUSH', KEYS[2], unpack(items))
+end
+return items
+"""
+
+
+def _redis():
+    return get_redis_connection("default")
+
+
+def enqueue_page(records, tagged_items):
+    """
+    Push a normalised page onto the ingestion queue.
+    Returns False when the queue is at its limit so the caller can write inline.
+    """
+    conn = _redis()
+    if conn.llen(QUEUE_KEY) >= settings.INGEST_QUEUE_MAX_LENGTH:
+        conn.hincrby(STATS_KEY, "rejected", 1)
+        return False
+
+    payload = json.dumps({"records": records, "tags": tagged_items, "enqueued_at": time.time()})
+    pipe = conn.pipeline()
+    pipe.rpush(QUEUE_KEY, payload)
+    pipe.hincrby(STATS_KEY, "enqueued", 1)
+    pipe.execute()
+    return True
+
+
+def _ingest(raw_pages):
+    """Upsert several queued pages with one ingest_page call."""
+    records, tagged_items = [], []
+    for raw in raw_pages:
+        page = json.loads(raw)
+        records.extend(page["records"])
+        tagged_items.extend(page["tags"])
+    ingest_page(records, tagged_items)
+    return len(records)
+
+
+def drain_batch(consumer="default", batch_size=None):
+    """
+    Ingest up to batch_size queued pages. Pages stay on the consumer's
+    processing list until written, so a crashed worker resumes them on restart.
+    Returns the number of pages taken from the queue.
+    """
+    conn = _redis()
+    processing_key = PROCESSING_KEY_PREFIX + consumer
+    batch_size = batch_size or settings.INGEST_BATCH_SIZE
+
+    # Resume anything a previous run of this consumer left behind
+    raw_pages = conn.lrange(processing_key, 0, -1)
+    if not raw_pages:
+        raw_pages = conn.eval(_TAKE_BATCH, 2, QUEUE_KEY, processing_key, batch_size)
+    if not raw_pages:
+        return 0
+
+    try:
+        items = _ingest(raw_pages)
+        failed = 0
+    except (OperationalError, InterfaceError):
+        # Database unavailable: keep the pages on the processing list for the next run
+        raise
+    except Exception as e:
+        # Retry page by page so a single bad payload cannot block the queue
+        logger.error(f"Ingest batch of {len(raw_pages)} pages failed, retrying singly: {e}")
+        items, failed = 0, 0
+        for raw in raw_pages:
+            try:
+                items += _ingest([raw])
+            except Exception as page_error:
+                logger.error(f"Moving unprocessable page to {DEAD_LETTER_KEY}: {page_error}")
+                conn.rpush(DEAD_LETTER_KEY, raw)
+                failed += 1
+
+    pipe = conn.pipeline()
+    pipe.delete(processing_key)
+    pipe.hincrby(STATS_KEY, "processed_pages", len(raw_pages) - failed)
+    pipe.hincrby(STATS_KEY, "processed_items", items)
+    pipe.hincrby(STATS_KEY, "failed_pages", failed)
+    pipe.hset(STATS_KEY, "last_flush_at", time.time())
+    pipe.execute()
+
+    logger.info(f"Ingested {len(raw_pages) - failed} queued pages ({items} items)")
+    return len(raw_pages)
+
+
+def queue_stats():
+    """Return queue depth, lag and counters for monitoring backpressure."""
+    conn = _redis()
+    pipe = conn.pipeline()
+    pipe.llen(QUEUE_KEY)
+    pipe.lindex(QUEUE_KEY, 0)
+    pipe.llen(DEAD_LETTER_KEY)
+    pipe.hgetall(STATS_KEY)
+    depth, oldest, dead, counters = pipe.execute()
+
+    lag = time.time() - json.loads(oldest)["enqueued_at"] if oldest else 0.0
+    stats = {key.decode(): float(value) for key, value in counters.items()}
+    stats.update({"depth": depth, "dead_letters": dead, "lag_seconds": round(lag, 3)})
+    return stats
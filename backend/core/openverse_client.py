@@ -1,8 +1,162 @@
 # backend/core/openverse_client.py
 
+import asyncio
+import os
+import random
+import threading
+import time
+
+import httpx
 import requests
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.core.cache import cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from core.analytics.metrics import observe_openverse
+from core.circuit_breaker import CLOSED, CircuitBreaker, CircuitOpenError
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class OpenverseError(RuntimeError):
+    """Openverse answered with a non-200 status."""
+
+    def __init__(self, message, status_code=None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def is_upstream_failure(exc):
+    """Whether an exception means Openverse is unhealthy, as opposed to a bad request."""
+    if isinstance(exc, CircuitOpenError):
+        return False
+    if isinstance(exc, OpenverseError):
+        return exc.status_code is None or exc.status_code in RETRY_STATUSES
+    return isinstance(exc, (requests.RequestException, httpx.HTTPError, TimeoutError))
+
+
+def _outcome(exc):
+    """Status label for a failed call in the Openverse latency metric."""
+    if isinstance(exc, OpenverseError) and exc.status_code is not None:
+        return str(exc.status_code)
+    return "error"
+
+
+_session = None
+_session_pid = None
+_session_lock = threading.Lock()
+
+_async_clients = {}  # (pid, event loop) -> httpx.AsyncClient
+
+
+class CappedRetry(Retry):
+    """Retry policy that honours Retry-After for at most OPENVERSE_MAX_RETRY_AFTER seconds."""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, settings.OPENVERSE_MAX_RETRY_AFTER)
+
+
+def _build_session():
+    """Build a keep-alive session with a bounded pool and jittered retries."""
+    retry = CappedRetry(
+        total=settings.OPENVERSE_MAX_RETRIES,
+        backoff_factor=settings.OPENVERSE_RETRY_BACKOFF,
+        backoff_jitter=settings.OPENVERSE_RETRY_JITTER,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({"GET", "POST"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,  # hand the last response back so callers can report it
+    )
+    adapter = HTTPAdapter(
+        pool_connections=settings.OPENVERSE_POOL_CONNECTIONS,
+        pool_maxsize=settings.OPENVERSE_POOL_MAXSIZE,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session():
+    """
+    Return the pooled session for this process.
+    A new session is built after a fork so workers never share sockets.
+    """
+    global _session, _session_pid
+
+    pid = os.getpid()
+    if _session is None or _session_pid != pid:
+        with _session_lock:
+            if _session is None or _session_pid != pid:
+                _session = _build_session()
+                _session_pid = pid
+    return _session
+
+
+def pool_stats():
+    """Return per-host connection pool statistics for this process's session."""
+    stats = []
+    if _session is None or _session_pid != os.getpid():
+        return stats
+
+    # Both schemes are mounted on the same adapter, so only visit it once
+    adapters = {id(adapter): adapter for adapter in _session.adapters.values()}
+    for adapter in adapters.values():
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None or pool.pool is None:
+                continue
+            # The queue is pre-filled with None placeholders for unopened slots
+            idle = sum(1 for conn in list(pool.pool.queue) if conn is not None)
+            stats.append(
+                {
+                    "scheme": pool.scheme,
+                    "host": pool.host,
+                    "port": pool.port,
+                    "maxsize": pool.pool.maxsize,
+                    "idle_connections": idle,
+                    "connections_opened": pool.num_connections,
+                    "requests_sent": pool.num_requests,
+                }
+            )
+    return stats
+
+
+def get_async_client():
+    """Return the pooled httpx.AsyncClient for this process and running event loop."""
+    key = (os.getpid(), asyncio.get_running_loop())
+    client = _async_clients.get(key)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.OPENVERSE_ASYNC_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.OPENVERSE_POOL_MAXSIZE,
+            ),
+            timeout=httpx.Timeout(
+                settings.OPENVERSE_READ_TIMEOUT, connect=settings.OPENVERSE_CONNECT_TIMEOUT
+            ),
+        )
+        _async_clients[key] = client
+    return client
+
+
+def _retry_delay(attempt, resp=None):
+    """
+    Jittered exponential backoff, deferring to a numeric Retry-After header
+    for at most OPENVERSE_MAX_RETRY_AFTER seconds, as the sync client does.
+    """
+    retry_after = resp.headers.get("Retry-After") if resp is not None else None
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), settings.OPENVERSE_MAX_RETRY_AFTER)
+    backoff = settings.OPENVERSE_RETRY_BACKOFF * (2**attempt)
+    return backoff + random.uniform(0, settings.OPENVERSE_RETRY_JITTER)
 
 
 class OpenverseClient:
@@ -12,16 +166,39 @@ class OpenverseClient:
     """
 
     TOKEN_CACHE_KEY = "openverse_access_token"
+    TOKEN_LOCK_KEY = "openverse_access_token:lock"
     TOKEN_TTL_BUFFER = 60  # seconds before actual expiration to refresh the token
+    TOKEN_REFRESH_AHEAD = 300  # seconds before expiry one caller refreshes proactively
+    TOKEN_LOCK_TIMEOUT = 30  # seconds the refresh lock is held at most
+    TOKEN_LOCK_WAIT = 10  # seconds callers wait for another worker's refresh
+
+    # Shared across workers through the cache
+    breaker = CircuitBreaker(
+        "openverse",
+        failure_threshold=settings.OPENVERSE_BREAKER_FAILURES,
+        window=settings.OPENVERSE_BREAKER_WINDOW,
+        recovery_timeout=settings.OPENVERSE_BREAKER_RECOVERY,
+        trial_timeout=settings.OPENVERSE_READ_TIMEOUT * 2,
+    )
+
+    # In-process copy of the token so the hot path skips Redis
+    _local_token = None
+    _local_expires_at = 0.0
+    _local_lock = threading.Lock()
 
     def __init__(self, api_url=None, client_id=None, client_secret=None):
         self.api_url = api_url or settings.OPENVERSE_API_URL
         self.client_id = client_id or settings.OPENVERSE_CLIENT_ID
         self.client_secret = client_secret or settings.OPENVERSE_CLIENT_SECRET
 
+    @property
+    def timeout(self):
+        """(connect, read) timeout applied to every upstream call."""
+        return (settings.OPENVERSE_CONNECT_TIMEOUT, settings.OPENVERSE_READ_TIMEOUT)
+
     def _fetch_token(self):
         """Fetch a fresh token from the Openverse token endpoint."""
-        resp = requests.post(
+        resp = get_session().post(
             f"{self.api_url}auth_tokens/token/",
             data={
                 "grant_type": "client_credentials",
@@ -31,32 +208,110 @@ class OpenverseClient:
             headers={
                 "Content-Type": "application/x-www-form-urlencoded",
             },
+            timeout=self.timeout,
         )
 
         if resp.status_code != 200:
-            raise RuntimeError(f"Failed to fetch token: {resp.status_code} - {resp.text}")
+            raise OpenverseError(
+                f"Failed to fetch token: {resp.status_code} - {resp.text}", resp.status_code
+            )
 
         data = resp.json()
         token = data["access_token"]
         expires_in = data.get("expires_in", 0)
+        expires_at = time.time() + expires_in - self.TOKEN_TTL_BUFFER
 
         # Cache with TTL slightly shorter than the actual expiration time
-        cache.set(self.TOKEN_CACHE_KEY, token, timeout=(expires_in - self.TOKEN_TTL_BUFFER))
+        cache.set(
+            self.TOKEN_CACHE_KEY,
+            {"token": token, "expires_at": expires_at},
+            timeout=(expires_in - self.TOKEN_TTL_BUFFER),
+        )
+        self._remember(token, expires_at)
 
         return token
 
+    @staticmethod
+    def _remember(token, expires_at):
+        """Keep a copy of the shared token in this process, for every client instance."""
+        with OpenverseClient._local_lock:
+            OpenverseClient._local_token = token
+            OpenverseClient._local_expires_at = expires_at
+
+    def _forget_token(self, token):
+        """Drop a token Openverse rejected from this process and the shared cache."""
+        with OpenverseClient._local_lock:
+            if OpenverseClient._local_token == token:
+                OpenverseClient._local_token = None
+                OpenverseClient._local_expires_at = 0.0
+        entry = cache.get(self.TOKEN_CACHE_KEY)
+        if isinstance(entry, dict) and entry.get("token") == token:
+            cache.delete(self.TOKEN_CACHE_KEY)
+
+    @classmethod
+    def _local_fresh_token(cls):
+        """Return the in-process token unless it is due for refresh."""
+        if cls._local_token and time.time() < cls._local_expires_at - cls.TOKEN_REFRESH_AHEAD:
+            return cls._local_token
+        return None
+
+    def _cached_entry(self):
+        """Return the shared {token, expires_at} entry, or None if missing/expired."""
+        entry = cache.get(self.TOKEN_CACHE_KEY)
+        if not isinstance(entry, dict) or time.time() >= entry["expires_at"]:
+            return None
+        return entry
+
+    def _refresh_single_flight(self, current=None):
+        """
+        Refresh the token with one caller across all workers.
+        With a still-valid current token the lock is only tried, and losers keep
+        using it; without one, callers wait for the winner and reuse its token.
+        """
+        lock = cache.lock(
+            self.TOKEN_LOCK_KEY,
+            timeout=self.TOKEN_LOCK_TIMEOUT,
+            blocking_timeout=self.TOKEN_LOCK_WAIT,
+        )
+        if not lock.acquire(blocking=current is None):
+            if current is not None:
+                return current["token"]
+            # The refreshing worker is stuck; fetch rather than fail the request
+            return self._fetch_token()
+
+        try:
+            # Another worker may have refreshed while we waited for the lock
+            entry = self._cached_entry()
+            if entry and time.time() < entry["expires_at"] - self.TOKEN_REFRESH_AHEAD:
+                self._remember(entry["token"], entry["expires_at"])
+                return entry["token"]
+            return self._fetch_token()
+        finally:
+            try:
+                lock.release()
+            except Exception:
+                pass  # lock expired while fetching
+
     def get_token(self):
-        """Retrieve token from cache or fetch a new one if expired/missing."""
-        token = cache.get(self.TOKEN_CACHE_KEY)
+        """
+        Retrieve token from the process copy or cache, refreshing it shortly
+        before expiry or when expired/missing.
+        """
+        token = self._local_fresh_token()
+        if token:
+            return token
 
-        if not token:
-            token = self._fetch_token()
+        entry = self._cached_entry()
+        if entry and time.time() < entry["expires_at"] - self.TOKEN_REFRESH_AHEAD:
+            self._remember(entry["token"], entry["expires_at"])
+            return entry["token"]
 
-        return token
+        return self._refresh_single_flight(current=entry)
 
     def query(self, endpoint, params=None, method="GET", data=None, **kwargs):
         """
         Generic method to query any Openverse API endpoint.
+        Calls go through the circuit breaker; CircuitOpenError is raised while it is open.
 
         :param endpoint: path relative to api_url, e.g. 'images' or 'audio'
         :param params: dict of querystring parameters
@@ -64,14 +319,116 @@ class OpenverseClient:
         :param data: dict for POST payload
         :return: JSON response
         """
+        start = time.perf_counter()
+        try:
+            state = self.breaker.before_call()
+        except CircuitOpenError:
+            observe_openverse(endpoint, "circuit_open", 0.0)
+            raise
+        try:
+            result = self._query(endpoint, params=params, method=method, data=data, **kwargs)
+        except Exception as e:
+            observe_openverse(endpoint, _outcome(e), time.perf_counter() - start)
+            if is_upstream_failure(e):
+                self.breaker.record_failure(state)
+            else:
+                self.breaker.record_success(state)
+            raise
+        observe_openverse(endpoint, "200", time.perf_counter() - start)
+        self.breaker.record_success(state)
+        return result
+
+    def _query(self, endpoint, params=None, method="GET", data=None, **kwargs):
+        url = f"{self.api_url}{endpoint.lstrip("/")}/"
+        kwargs.setdefault("timeout", self.timeout)
+
+        def send(token):
+            headers = {"Authorization": f"Bearer {token}"}
+            return get_session().request(
+                method.upper(), url, headers=headers, params=params, json=data, **kwargs
+            )
 
         token = self.get_token()
+        resp = send(token)
+        if resp.status_code == 401:
+            # Revoked or rotated before its expiry: drop every copy and retry once
+            self._forget_token(token)
+            resp = send(self.get_token())
+
+        if resp.status_code != 200:
+            raise OpenverseError(
+                f"Failed to query {url}: {resp.status_code} - {resp.text}", resp.status_code
+            )
+
+        return resp.json()
+
+
+class AsyncOpenverseClient(OpenverseClient):
+    """
+    Non-blocking variant of OpenverseClient for async views.
+    Shares token caching with the sync client and keeps a pooled httpx client
+    per event loop, with the same timeouts and retry policy.
+    """
+
+    async def query(self, endpoint, params=None, method="GET", data=None, **kwargs):
+        """Async equivalent of OpenverseClient.query."""
+        start = time.perf_counter()
+        try:
+            state = await sync_to_async(self.breaker.before_call)()
+        except CircuitOpenError:
+            observe_openverse(endpoint, "circuit_open", 0.0)
+            raise
+        try:
+            result = await self._aquery(endpoint, params=params, method=method, data=data, **kwargs)
+        except Exception as e:
+            observe_openverse(endpoint, _outcome(e), time.perf_counter() - start)
+            if is_upstream_failure(e):
+                await sync_to_async(self.breaker.record_failure)(state)
+            elif state != CLOSED:
+                await sync_to_async(self.breaker.record_success)(state)
+            raise
+        observe_openverse(endpoint, "200", time.perf_counter() - start)
+        # Successes only touch shared state when closing a half-open breaker
+        if state != CLOSED:
+            await sync_to_async(self.breaker.record_success)(state)
+        return result
+
+    async def _aquery(self, endpoint, params=None, method="GET", data=None, **kwargs):
         url = f"{self.api_url}{endpoint.lstrip("/")}/"
-        headers = {"Authorization": f"Bearer {token}"}
-        func = getattr(requests, method.lower())
-        resp = func(url, headers=headers, params=params, json=data, **kwargs)
+        token = self._local_fresh_token() or await sync_to_async(self.get_token)()
+        resp = await self._asend(url, token, method, params, data, **kwargs)
+        if resp.status_code == 401:
+            # Revoked or rotated before its expiry: drop every copy and retry once
+            await sync_to_async(self._forget_token)(token)
+            token = await sync_to_async(self.get_token)()
+            resp = await self._asend(url, token, method, params, data, **kwargs)
 
         if resp.status_code != 200:
-            raise RuntimeError(f"Failed to query {url}: {resp.status_code} - {resp.text}")
+            raise OpenverseError(
+                f"Failed to query {url}: {resp.status_code} - {resp.text}", resp.status_code
+            )
 
         return resp.json()
+
+    async def _asend(self, url, token, method, params, data, **kwargs):
+        """Send one request, retrying transport errors and retryable statuses."""
+        headers = {"Authorization": f"Bearer {token}"}
+        client = get_async_client()
+
+        for attempt in range(settings.OPENVERSE_MAX_RETRIES + 1):
+            retries_left = attempt < settings.OPENVERSE_MAX_RETRIES
+            try:
+                resp = await client.request(
+                    method.upper(), url, headers=headers, params=params, json=data, **kwargs
+                )
+            except httpx.TransportError:
+                if not retries_left:
+                    raise
+                await asyncio.sleep(_retry_delay(attempt))
+                continue
+
+            if resp.status_code in RETRY_STATUSES and retries_left:
+                await asyncio.sleep(_retry_delay(attempt, resp))
+                continue
+            break
+        return resp
@@ -0,0 +1,103 @@
+# backend/core/pagination.py
+
+import base64
+import json
+
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Newest-first cursor pagination on (ordering_field, id).
+
+    Each page seeks past the last row of the previous one, so with a matching
+    (user, ordering_field, id) index a deep page costs the same as the first.
+    The total count is only computed when asked for with ?count=true.
+    Requests that still send ?page= are served by page-number pagination.
+    """
+
+    ordering_field = None
+    page_size = 24
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    count_query_param = "count"
+    legacy_page_query_param = "page"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.legacy = None
+        if self.legacy_page_query_param in request.query_params:
+            self.legacy = PageNumberPagination()
+            self.legacy.page_size = self.page_size
+            self.legacy.page_size_query_param = self.page_size_query_param
+            self.legacy.max_page_size = self.max_page_size
+            return self.legacy.paginate_queryset(
+                queryset.order_by(f"-{self.ordering_field}", "-id"), request, view
+            )
+
+        self.count = None
+        if request.query_params.get(self.count_query_param, "").lower() in ("1", "true"):
+            self.count = queryset.count()
+
+        queryset = queryset.order_by(f"-{self.ordering_field}", "-id")
+        cursor = self.decode_cursor(request)
+        if cursor is not None:
+            value, pk = cursor
+            # (field, id) < (value, pk), phrased so the index range scan applies
+            queryset = queryset.filter(**{f"{self.ordering_field}__lte": value}).exclude(
+                **{self.ordering_field: value, "id__gte": pk}
+            )
+
+        page_size = self.get_page_size(request)
+        rows = list(queryset[: page_size + 1])
+        self.has_next = len(rows) > page_size
+        self.page = rows[:page_size]
+        return self.page
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(size, 1), self.max_page_size)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            value, pk = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            value = parse_datetime(value)
+            if value is None:
+                raise ValueError(value)
+            return value, int(pk)
+        except (TypeError, ValueError):
+            raise NotFound("Invalid cursor")
+
+    def encode_cursor(self, item):
+        value = getattr(item, self.ordering_field).isoformat()
+        return base64.urlsafe_b64encode(json.dumps([value, item.pk]).encode()).decode()
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.page[-1]))
+
+    def get_first_link(self):
+        url = self.request.build_absolute_uri()
+        return remove_query_param(url, self.cursor_query_param)
+
+    def get_paginated_response(self, data):
+        if self.legacy is not None:
+            return self.legacy.get_paginated_response(data)
+
+        payload = {"next": self.get_next_link(), "first": self.get_first_link(), "results": data}
+        if self.count is not None:
+            payload["count"] = self.count
+        return Response(payload)
@@ -0,0 +1,139 @@
+# backend/core/search/cache.py
+
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import close_old_connections
+
+from core.analytics.metrics import count_cache
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = "search:results:"
+REFRESH_LOCK_PREFIX = "search:refresh:"
+REFRESH_LOCK_TIMEOUT = 60  # seconds a single background refresh may hold the lock
+
+_background_tasks = set()  # strong references to in-flight async refreshes
+
+
+def make_cache_key(params):
+    """Build a stable cache key from the normalised search parameters."""
+    normalised = {**params, "search_value": params["search_value"].casefold()}
+    raw = json.dumps(normalised, sort_keys=True, separators=(",", ":"))
+    return CACHE_KEY_PREFIX + hashlib.sha1(raw.encode()).hexdigest()
+
+
+def _entry(payload):
+    """
+    Wrap a payload with its freshness deadline.
+    Partial payloads are stored already stale so the next hit refreshes them.
+    """
+    ttl = 0 if payload.get("partial") else settings.SEARCH_CACHE_TTL
+    return {
+        "payload": payload,
+        "fresh_until": time.time() + ttl,
+    }
+
+
+def _entry_timeout():
+    """Keep entries around past their TTL so they can be served stale."""
+    return settings.SEARCH_CACHE_TTL + settings.SEARCH_CACHE_STALE_TTL
+
+
+def _store(key, payload):
+    """Cache a payload under key."""
+    cache.set(key, _entry(payload), timeout=_entry_timeout())
+
+
+def _refresh(key, fetch):
+    """Re-run fetch and store the result, releasing the refresh lock afterwards."""
+    try:
+        _store(key, fetch())
+        logger.debug(f"Refreshed stale search cache entry {key}")
+    except Exception as e:
+        logger.warning(f"Background refresh of {key} failed: {e}")
+    finally:
+        cache.delete(REFRESH_LOCK_PREFIX + key)
+        close_old_connections()
+
+
+def _refresh_in_background(key, fetch):
+    """Start a refresh thread unless another worker is already refreshing this key."""
+    if not cache.add(REFRESH_LOCK_PREFIX + key, 1, timeout=REFRESH_LOCK_TIMEOUT):
+        return
+    threading.Thread(target=_refresh, args=(key, fetch), daemon=True).start()
+
+
+def get_or_fetch(params, fetch):
+    """
+    Return the cached search payload for params, calling fetch() on a miss.
+    Stale entries are served straight away and refreshed in a background thread.
+    """
+    if settings.SEARCH_CACHE_TTL <= 0:
+        return fetch()
+
+    key = make_cache_key(params)
+    entry = cache.get(key)
+
+    if entry is None:
+        count_cache("search", "miss")
+        logger.debug(f"Search cache miss for {key}")
+        payload = fetch()
+        _store(key, payload)
+        return payload
+
+    if time.time() >= entry["fresh_until"]:
+        count_cache("search", "stale")
+        logger.debug(f"Search cache stale for {key}, serving and refreshing")
+        _refresh_in_background(key, fetch)
+    else:
+        count_cache("search", "hit")
+        logger.debug(f"Search cache hit for {key}")
+
+    return entry["payload"]
+
+
+async def _arefresh(key, afetch):
+    """Async equivalent of _refresh, run as a background task on the event loop."""
+    try:
+        await cache.aset(key, _entry(await afetch()), timeout=_entry_timeout())
+        logger.debug(f"Refreshed stale search cache entry {key}")
+    except Exception as e:
+        logger.warning(f"Background refresh of {key} failed: {e}")
+    finally:
+        await cache.adelete(REFRESH_LOCK_PREFIX + key)
+
+
+async def aget_or_fetch(params, afetch):
+    """Async equivalent of get_or_fetch; stale entries refresh in a background task."""
+    if settings.SEARCH_CACHE_TTL <= 0:
+        return await afetch()
+
+    key = make_cache_key(params)
+    entry = await cache.aget(key)
+
+    if entry is None:
+        count_cache("search", "miss")
+        logger.debug(f"Search cache miss for {key}")
+        payload = await afetch()
+        await cache.aset(key, _entry(payload), timeout=_entry_timeout())
+        return payload
+
+    if time.time() >= entry["fresh_until"]:
+        count_cache("search", "stale")
+        logger.debug(f"Search cache stale for {key}, serving and refreshing")
+        if await cache.aadd(REFRESH_LOCK_PREFIX + key, 1, timeout=REFRESH_LOCK_TIMEOUT):
+            task = asyncio.create_task(_arefresh(key, afetch))
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
+    else:
+        count_cache("search", "hit")
+        logger.debug(f"Search cache hit for {key}")
+
+    return entry["payload"]
@@ -0,0 +1,192 @@
+# backend/core/search/history.py
+
+import json
+import logging
+import time
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.db import connection, transaction
+from django_redis import get_redis_connection
+
+from .models import SearchHistory
+
+logger = logging.getLogger(__name__)
+
+QUEUE_KEY = "search:history:queue"
+FLUSHING_KEY = "search:history:flushing"
+
+# Swap the live queue out for flushing, unless a previous flush left one behind
+_CLAIM = """
+if redis.call('EXISTS', KEYS[2]) == 0 and redis.call('EXISTS', KEYS[1]) == 1 then
+    redis.call('RENAME', KEYS[1], KEYS[2])
+end
+return redis.call('EXISTS', KEYS[2])
+"""
+
+# Keep each listed user's newest max_rows entries, in one statement
+_TRIM_SQL = """
+DELETE FROM search_history
+WHERE id IN (
+    SELECT id FROM (
+        SELECT id, row_number() OVER (
+            PARTITION BY user_id ORDER BY searched_at DESC, id DESC
+        ) AS position
+        FROM search_history
+        {where}
+    ) AS ranked
+    WHERE ranked.position > %s
+)
+"""
+
+
+# Fold a repeat of the user's latest search into that row, via the user index
+_BUMP_LATEST_SQL = """
+UPDATE search_history
+SET search_count = search_count + 1, searched_at = GREATEST(searched_at, %s)
+WHERE id = (
+    SELECT id FROM search_history
+    WHERE user_id = %s
+    ORDER BY searched_at DESC, id DESC
+    LIMIT 1
+)
+AND search_key = %s AND lower(search_value) = lower(%s)
+"""
+
+
+def _redis():
+    return get_redis_connection("default")
+
+
+def _same_search(a_key, a_value, b_key, b_value):
+    return a_key == b_key and a_value.casefold() == b_value.casefold()
+
+
+def record_search(user, search_key, search_value, page=1):
+    """
+    Record a search in the user's history. Pagination clicks are not new searches.
+    In buffered mode the entry is queued in Redis for flush_history(), falling
+    back to an inline write if Redis is unavailable. The retention cap is
+    enforced in bulk by the history worker, never per search.
+    """
+    if page > 1:
+        return
+
+    entry = {
+        "user_id": str(user.pk),
+        "search_key": search_key,
+        "search_value": search_value,
+        "searched_at": time.time(),
+    }
+    if settings.SEARCH_HISTORY_WRITE_MODE == "buffered":
+        try:
+            _redis().rpush(QUEUE_KEY, json.dumps(entry))
+            return
+        except Exception as e:
+            logger.warning(f"Failed to buffer search history, writing inline: {e}")
+    write_entry(entry)
+
+
+def write_entry(entry):
+    """
+    Write one search inline: a single UPDATE when it repeats the user's latest
+    search, otherwise that UPDATE (matching nothing) and one INSERT.
+    """
+    searched_at = datetime.fromtimestamp(entry["searched_at"], dt_timezone.utc)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            _BUMP_LATEST_SQL,
+            [searched_at, entry["user_id"], entry["search_key"], entry["search_value"]],
+        )
+        if cursor.rowcount:
+            return
+    SearchHistory.objects.create(
+        user_id=entry["user_id"],
+        search_key=entry["search_key"],
+        search_value=entry["search_value"],
+        searched_at=searched_at,
+    )
+
+
+def write_entries(entries):
+    """
+    Write history entries in bulk. Consecutive identical searches by a user,
+    including a repeat of their latest stored search, are collapsed into one
+    row whose search_count grows and whose searched_at moves forward.
+    Returns the ids of the users written.
+    """
+    by_user = {}
+    for entry in sorted(entries, key=lambda e: e["searched_at"]):
+        by_user.setdefault(entry["user_id"], []).append(entry)
+
+    latest = {
+        str(row.user_id): row
+        for row in SearchHistory.objects.filter(user_id__in=list(by_user))
+        .order_by("user_id", "-searched_at", "-id")
+        .distinct("user_id")
+    }
+
+    to_update, to_create = {}, []
+    for user_id, user_entries in by_user.items():
+        current = latest.get(user_id)
+        for entry in user_entries:
+            searched_at = datetime.fromtimestamp(entry["searched_at"], dt_timezone.utc)
+            if current is not None and _same_search(
+                current.search_key, current.search_value, entry["search_key"], entry["search_value"]
+            ):
+                current.search_count += 1
+                current.searched_at = max(current.searched_at, searched_at)
+                if current.pk is not None:
+                    to_update[current.pk] = current
+                continue
+
+            current = SearchHistory(
+                user_id=user_id,
+                search_key=entry["search_key"],
+                search_value=entry["search_value"],
+                searched_at=searched_at,
+            )
+            to_create.append(current)
+
+    with transaction.atomic():
+        SearchHistory.objects.bulk_update(to_update.values(), ["search_count", "searched_at"])
+        SearchHistory.objects.bulk_create(to_create)
+
+    return list(by_user)
+
+
+def trim_history(user_ids=None, max_rows=None):
+    """
+    Enforce the per-user retention cap with a single DELETE, for the given
+    users or for everyone. Returns the number of rows removed.
+    """
+    max_rows = max_rows or settings.SEARCH_HISTORY_MAX_PER_USER
+    where, params = "", []
+    if user_ids is not None:
+        if not user_ids:
+            return 0
+        where, params = "WHERE user_id = ANY(%s::uuid[])", [list(user_ids)]
+
+    with connection.cursor() as cursor:
+        cursor.execute(_TRIM_SQL.format(where=where), [*params, max_rows])
+        return cursor.rowcount
+
+
+def flush_history():
+    """
+    Write buffered searches to SearchHistory and trim the users they touched.
+    Returns the number of entries flushed.
+    """
+    conn = _redis()
+    if not conn.eval(_CLAIM, 2, QUEUE_KEY, FLUSHING_KEY):
+        return 0
+
+    entries = [json.loads(raw) for raw in conn.lrange(FLUSHING_KEY, 0, -1)]
+    user_ids = write_entries(entries)
+    removed = trim_history(user_ids)
+
+    conn.delete(FLUSHING_KEY)
+    logger.info(
+        f"Flushed {len(entries)} searches for {len(user_ids)} users, trimmed {removed} rows"
+    )
+    return len(entries)
@@ -0,0 +1,150 @@
+# backend/core/search/local.py
+
+import logging
+from math import ceil
+
+from django.conf import settings
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    TrigramWordSimilarity,
+)
+from django.db.models import Exists, F, OuterRef
+
+from core.media.models import Media, MediaTag
+
+logger = logging.getLogger(__name__)
+
+RESULT_FIELDS = [
+    "openverse_id",
+    "title",
+    "indexed_on",
+    "foreign_landing_url",
+    "url",
+    "creator",
+    "creator_url",
+    "license",
+    "license_version",
+    "license_url",
+    "attribution",
+    "source",
+    "category",
+    "file_size",
+    "file_type",
+    "mature",
+    "thumbnail_url",
+    "height",
+    "width",
+    "duration",
+    "media_type",
+]
+
+SUGGEST_FIELDS = ("title", "creator")
+SUGGEST_MIN_LENGTH = 2  # trigrams need a couple of characters to be selective
+
+# Sort keys the stored rows can honour; anything else falls back to indexed_on
+SORT_FIELDS = {"indexed_on", "title", "creator"}
+
+
+def media_to_result(media):
+    """Build the same flat dict SearchView returns for an Openverse item."""
+    data = {field: getattr(media, field) for field in RESULT_FIELDS}
+    data["indexed_on"] = media.indexed_on.isoformat()
+    return data
+
+
+def filter_media(queryset, params):
+    """Apply SearchView's media_type, mature and list filters to a Media queryset."""
+    if params["media_type"] in ("image", "audio"):
+        queryset = queryset.filter(media_type=params["media_type"])
+    if not params["mature"]:
+        queryset = queryset.filter(mature=False)
+    if params["source"]:
+        queryset = queryset.filter(source__in=params["source"])
+    if params["license"]:
+        queryset = queryset.filter(license__in=params["license"])
+    if params["extension"]:
+        queryset = queryset.filter(file_type__in=params["extension"])
+    return queryset
+
+
+def paginate(queryset, params, **extra):
+    """Slice one page of a Media queryset into SearchView's response shape."""
+    page = params["page"]
+    page_size = params["page_size"]
+    total_count = queryset.count()
+    start = (page - 1) * page_size
+
+    return {
+        "results": [media_to_result(m) for m in queryset[start : start + page_size]],
+        "page": page,
+        "page_size": page_size,
+        "total_count": total_count,
+        "total_pages": ceil(total_count / page_size),
+        **extra,
+    }
+
+
+def fulltext_search(params, **extra):
+    """
+    Search ingested media through the search_vector GIN index.
+    q matches title, creator and tags; title/creator additionally require the
+    match in that column, and tag requires an exact (case-insensitive) tag.
+    """
+    config = settings.SEARCH_TEXT_CONFIG
+    search_key = params["search_key"]
+    value = params["search_value"]
+    query = SearchQuery(value, config=config, search_type="websearch")
+
+    queryset = Media.objects.filter(search_vector=query).defer("search_vector")
+    if search_key in ("title", "creator"):
+        queryset = queryset.annotate(field_vector=SearchVector(search_key, config=config)).filter(
+            field_vector=query
+        )
+    elif search_key == "tag":
+        queryset = queryset.filter(
+            Exists(MediaTag.objects.filter(media=OuterRef("pk"), tag__name__iexact=value))
+        )
+    queryset = filter_media(queryset, params)
+
+    if params["sort_by"] == "relevance":
+        queryset = queryset.annotate(rank=SearchRank(F("search_vector"), query))
+        queryset = queryset.order_by("-rank", "-indexed_on", "-id")
+    else:
+        sort_by = params["sort_by"] if params["sort_by"] in SORT_FIELDS else "indexed_on"
+        order = sort_by if params["sort_dir"] == "asc" else f"-{sort_by}"
+        queryset = queryset.order_by(order, "-id")
+
+    return paginate(queryset, params, **extra)
+
+
+def local_search(params):
+    """
+    Answer a search from the Media/MediaTag rows already ingested.
+    Used as a degraded mode while Openverse is unavailable.
+    """
+    logger.info(
+        f"Serving degraded local search for {params['search_key']}='{params['search_value']}'"
+    )
+    return fulltext_search(params, partial=False, degraded=True)
+
+
+def suggest(value, field="title", limit=10):
+    """
+    Typeahead over a Media column, tolerant of misspellings.
+    Candidates come from the column's gin_trgm_ops index via the word
+    similarity operator and are ranked by similarity.
+    """
+    value = value.strip()
+    if field not in SUGGEST_FIELDS or len(value) < SUGGEST_MIN_LENGTH:
+        return []
+
+    rows = (
+        Media.objects.filter(**{f"{field}__trigram_word_similar": value})
+        .annotate(similarity=TrigramWordSimilarity(value, field))
+        .order_by("-similarity", field)
+        .values_list(field, "similarity")
+        .distinct()[:limit]
+    )
+    return [{"value": v, "similarity": round(sim, 3)} for v, sim in rows]
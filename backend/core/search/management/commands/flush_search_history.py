@@ -0,0 +1,62 @@
+# backend/core/search/management/commands/flush_search_history.py
+
+import logging
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from core.search.history import flush_history, trim_history
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Write buffered searches from Redis into SearchHistory and enforce the retention "
+        "cap, sweeping every user's history every SEARCH_HISTORY_TRIM_INTERVAL seconds."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=None,
+            help="Keep running, flushing every INTERVAL seconds (default: flush once).",
+        )
+        parser.add_argument(
+            "--trim-all",
+            action="store_true",
+            help="Trim every user's history to the cap and exit.",
+        )
+
+    def handle(self, *args, **options):
+        if options["trim_all"]:
+            removed = trim_history()
+            self.stdout.write(f"Trimmed {removed} search history rows.")
+            return
+
+        last_trim = time.monotonic()
+        while True:
+            close_old_connections()
+            try:
+                flushed = flush_history()
+                self.stdout.write(f"Flushed {flushed} buffered searches.")
+            except Exception as e:
+                if options["interval"] is None:
+                    raise
+                logger.error(f"Search history flush failed, retrying: {e}")
+
+            # Inline writes are not trimmed when made, so sweep everyone periodically
+            if time.monotonic() - last_trim >= settings.SEARCH_HISTORY_TRIM_INTERVAL:
+                try:
+                    removed = trim_history()
+                    self.stdout.write(f"Trimmed {removed} search history rows.")
+                except Exception as e:
+                    logger.error(f"Search history trim failed, retrying: {e}")
+                last_trim = time.monotonic()
+
+            if options["interval"] is None:
+                return
+            time.sleep(options["interval"])
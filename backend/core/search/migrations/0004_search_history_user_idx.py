@@ -0,0 +1,19 @@
+# Generated by Django 5.1.7 on 2026-10-18 13:39
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("search", "0003_rename_query_searchhistory_search_value_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="searchhistory",
+            index=models.Index(fields=["user", "searched_at", "id"], name="search_history_user_idx"),
+        ),
+    ]
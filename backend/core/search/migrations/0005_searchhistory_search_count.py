@@ -0,0 +1,24 @@
+# Generated by Django 5.1.7 on 2026-10-18 13:41
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("search", "0004_search_history_user_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="searchhistory",
+            name="search_count",
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.AlterField(
+            model_name="searchhistory",
+            name="searched_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
@@ -2,16 +2,23 @@
 
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
 
 
 class SearchHistory(models.Model):
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     search_key = models.CharField(max_length=10, default="q")
     search_value = models.CharField(max_length=255)
-    searched_at = models.DateTimeField(auto_now_add=True)
+    # Last time the search was made; repeats collapse into one row (core.search.history)
+    searched_at = models.DateTimeField(default=timezone.now)
+    search_count = models.PositiveIntegerField(default=1)
 
     class Meta:
         db_table = "search_history"
         verbose_name = "search history"
         verbose_name_plural = "search histories"
         ordering = ["-searched_at"]
+        indexes = [
+            # Keyset pagination of a user's history on (searched_at, id)
+            models.Index(fields=["user", "searched_at", "id"], name="search_history_user_idx"),
+        ]
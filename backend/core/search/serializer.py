@@ -6,5 +6,5 @@ from .models import SearchHistory
 class SearchHistorySerializer(serializers.ModelSerializer):
     class Meta:
         model = SearchHistory
-        fields = ["id", "search_key", "search_value", "searched_at"]
-        read_only_fields = ["id", "searched_at"]
+        fields = ["id", "search_key", "search_value", "searched_at", "search_count"]
+        read_only_fields = ["id", "searched_at", "search_count"]
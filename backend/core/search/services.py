@@ -0,0 +1,362 @@
+# backend/core/search/services.py
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from itertools import zip_longest
+from math import ceil
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.utils import timezone
+
+from core.media.ingest import ingest_page
+from core.media.write_behind import enqueue_page
+
+logger = logging.getLogger(__name__)
+
+SEARCH_KEYS = ["q", "title", "tag", "creator"]
+EMPTY_RESPONSE = {"results": [], "result_count": 0}
+
+# Shared, bounded pool for the image/audio fan-out
+_fanout_executor = ThreadPoolExecutor(
+    max_workers=settings.SEARCH_FANOUT_WORKERS, thread_name_prefix="openverse-fanout"
+)
+
+# One slot per pool worker, held until the call really finishes. Calls that overran
+# the deadline keep their slot, so a slow upstream makes new fan-outs fail fast
+# (and degrade) instead of queueing behind them.
+_fanout_slots = threading.BoundedSemaphore(settings.SEARCH_FANOUT_WORKERS)
+
+
+def _split_list(value):
+    """Split a comma separated querystring value into a sorted, de-duplicated list."""
+    return sorted({v.strip() for v in value.split(",") if v.strip()})
+
+
+def _positive_int(value, default):
+    """Parse a querystring number, falling back to default when it is not an integer."""
+    try:
+        return max(int(value), 1)
+    except (TypeError, ValueError):
+        return default
+
+
+def parse_search_params(query):
+    """
+    Normalise the search querystring into a plain dict.
+    The result is used both to query Openverse and as the search cache key.
+    """
+    # Get the search key and value from the request
+    search_key = next((k for k in SEARCH_KEYS if k in query), "q")
+    search_value = " ".join(query.get(search_key, "").split())
+
+    return {
+        "search_key": search_key,
+        "search_value": search_value,
+        "page": _positive_int(query.get("page"), 1),
+        "page_size": _positive_int(query.get("page_size"), 18),
+        # Get media_type and mature flags
+        "media_type": query.get("media_type", "image").lower(),
+        "mature": query.get("mature", "false").lower() == "true",
+        # Get sort parameters
+        "sort_by": query.get("sort_by", "relevance").lower(),
+        "sort_dir": query.get("sort_dir", "desc").lower(),
+        # Get filter parameters, split list by comma
+        "source": _split_list(query.get("source", "")),
+        "license": _split_list(query.get("license", "")),
+        "extension": _split_list(query.get("extension", "")),
+    }
+
+
+def build_openverse_params(params):
+    """Translate normalised search params into Openverse querystring params."""
+    ov_params = {
+        params["search_key"]: params["search_value"],
+        "page": params["page"],
+        "per_page": params["page_size"],
+        "unstable__include_sensitive_results": params["mature"],
+        "unstable__sort_by": params["sort_by"],
+        "unstable__sort_dir": params["sort_dir"],
+    }
+
+    # Add optional parameters if provided
+    for name in ("source", "license", "extension"):
+        if params[name]:
+            ov_params[name] = ",".join(params[name])
+
+    return ov_params
+
+
+def _submit(client, endpoint, ov_params):
+    """Start a query on the fan-out pool, or raise TimeoutError if every worker is busy."""
+    if not _fanout_slots.acquire(blocking=False):
+        raise TimeoutError(f"No fan-out worker free for Openverse {endpoint}")
+    # A single read may not outlast the shared deadline
+    timeout = (
+        settings.OPENVERSE_CONNECT_TIMEOUT,
+        min(settings.OPENVERSE_READ_TIMEOUT, settings.SEARCH_FANOUT_TIMEOUT),
+    )
+    future = _fanout_executor.submit(client.query, endpoint, params={**ov_params}, timeout=timeout)
+    future.add_done_callback(lambda _: _fanout_slots.release())
+    return future
+
+
+def _fan_out(client, ov_params):
+    """
+    Query images and audio concurrently under a shared deadline.
+    A side that fails, misses the deadline or finds the pool full contributes
+    no results; if both sides fail the first error is raised.
+    Returns (img_resp, aud_resp, partial).
+    """
+    futures = {}
+    errors = []
+    for kind, endpoint in (("image", "images"), ("audio", "audio")):
+        try:
+            futures[kind] = _submit(client, endpoint, ov_params)
+        except TimeoutError as e:
+            errors.append(e)
+            logger.warning(f"Dropping {kind} results from the merged search: {e}")
+    wait(futures.values(), timeout=settings.SEARCH_FANOUT_TIMEOUT)
+
+    responses = {}
+    for kind, future in futures.items():
+        if not future.done():
+            future.cancel()
+            errors.append(TimeoutError(f"Openverse {kind} query missed the deadline"))
+        elif future.exception() is not None:
+            errors.append(future.exception())
+        else:
+            responses[kind] = future.result()
+            continue
+        logger.warning(f"Dropping {kind} results from the merged search: {errors[-1]}")
+
+    if not responses:
+        raise errors[0]
+
+    return (
+        responses.get("image", EMPTY_RESPONSE),
+        responses.get("audio", EMPTY_RESPONSE),
+        bool(errors),
+    )
+
+
+def fetch_upstream(client, params):
+    """
+    Query the Openverse endpoints selected by media_type.
+    Returns (img_resp, aud_resp, partial) where partial flags a merged search
+    that is missing one side.
+    """
+    ov_params = build_openverse_params(params)
+
+    # Log the parameters being sent to Openverse
+    logger.debug(f"Parameters: {ov_params}")
+
+    # Only hit the endpoint the user wants
+    media_type = params["media_type"]
+    if media_type == "image":
+        return client.query("images", params={**ov_params}), EMPTY_RESPONSE, False
+    if media_type == "audio":
+        return EMPTY_RESPONSE, client.query("audio", params={**ov_params}), False
+
+    return _fan_out(client, ov_params)
+
+
+async def _afan_out(client, ov_params):
+    """Async equivalent of _fan_out, gathering both queries under the shared deadline."""
+    kinds = ("image", "audio")
+    tasks = [
+        asyncio.ensure_future(client.query(endpoint, params={**ov_params}))
+        for endpoint in ("images", "audio")
+    ]
+    done, pending = await asyncio.wait(tasks, timeout=settings.SEARCH_FANOUT_TIMEOUT)
+    for task in pending:
+        task.cancel()
+
+    responses = {}
+    errors = []
+    for kind, task in zip(kinds, tasks):
+        if task in pending:
+            errors.append(TimeoutError(f"Openverse {kind} query missed the deadline"))
+        elif task.exception() is not None:
+            errors.append(task.exception())
+        else:
+            responses[kind] = task.result()
+            continue
+        logger.warning(f"Dropping {kind} results from the merged search: {errors[-1]}")
+
+    if not responses:
+        raise errors[0]
+
+    return (
+        responses.get("image", EMPTY_RESPONSE),
+        responses.get("audio", EMPTY_RESPONSE),
+        bool(errors),
+    )
+
+
+async def afetch_upstream(client, params):
+    """Async equivalent of fetch_upstream for an AsyncOpenverseClient."""
+    ov_params = build_openverse_params(params)
+    logger.debug(f"Parameters: {ov_params}")
+
+    media_type = params["media_type"]
+    if media_type == "image":
+        return await client.query("images", params={**ov_params}), EMPTY_RESPONSE, False
+    if media_type == "audio":
+        return EMPTY_RESPONSE, await client.query("audio", params={**ov_params}), False
+
+    return await _afan_out(client, ov_params)
+
+
+def _mark_items(resp, media_type):
+    """Add media_type and mature flags to raw Openverse items."""
+    items = []
+    for item in resp.get("results", []):
+        item["media_type"] = media_type
+        is_sensitive = bool(item.get("mature")) or bool(item.get("unstable__sensitivity"))
+        item["mature"] = is_sensitive
+        items.append(item)
+    return items
+
+
+def merge_results(params, img_resp, aud_resp):
+    """
+    Merge image and audio responses into a single page of raw items.
+    Returns (page_items, total_count, total_pages).
+    """
+    page = params["page"]
+    page_size = params["page_size"]
+    sort_by = params["sort_by"]
+    sort_dir = params["sort_dir"]
+
+    for kind, resp in (("img", img_resp), ("aud", aud_resp)):
+        results = resp.get("results", [])
+        logger.debug(f"{kind}_resp returned {len(results)} results")
+        if results:
+            logger.debug("%s_resp keys: %s", kind, list(results[0].keys()))
+
+    # Sum the totals
+    img_total = img_resp.get("result_count", len(img_resp.get("results", [])))
+    aud_total = aud_resp.get("result_count", len(aud_resp.get("results", [])))
+    total_count = img_total + aud_total
+    total_pages = ceil(total_count / page_size)
+
+    # Log total count and pages
+    logger.info(f"Total results: {total_count}, Total pages: {total_pages}")
+
+    img_items = _mark_items(img_resp, "image")
+    aud_items = _mark_items(aud_resp, "audio")
+
+    # Merge the two lists respecting the sort order
+    if sort_by == "relevance":
+        # Interleave, zip_longest handles uneven lists
+        merged = []
+        for img, aud in zip_longest(img_items, aud_items, fillvalue=None):
+            if img:
+                merged.append(img)
+            if aud:
+                merged.append(aud)
+    else:
+        # Timestamp or other global sort
+        merged = sorted(
+            img_items + aud_items,
+            key=lambda i: i.get(sort_by) or "indexed_on",
+            reverse=(sort_dir == "desc"),
+        )
+
+    # Slice for this page
+    start = (page - 1) * page_size
+    end = start + page_size
+    page_items = merged[start:end]
+
+    # Log the number of items being returned for this page
+    logger.info(f"Returning {len(page_items)} items for page {page}.")
+
+    return page_items, total_count, total_pages
+
+
+def normalise_item(item):
+    """Build the flat Media dict for a raw Openverse item."""
+    return {
+        "openverse_id": item["id"],
+        "title": item.get("title"),
+        "indexed_on": item.get("indexed_on") or timezone.now().isoformat(),
+        "foreign_landing_url": item.get("foreign_landing_url"),
+        "url": item.get("url"),
+        "creator": item.get("creator"),
+        "creator_url": item.get("creator_url"),
+        "license": item.get("license"),
+        "license_version": item.get("license_version"),
+        "license_url": item.get("license_url"),
+        "attribution": item.get("attribution"),
+        "source": item.get("source"),
+        "category": item.get("category"),
+        "file_size": item.get("filesize"),
+        "file_type": item.get("filetype"),
+        "mature": item["mature"],
+        "thumbnail_url": item.get("thumbnail"),
+        "height": item.get("height"),
+        "width": item.get("width"),
+        "duration": item.get("duration"),
+        "media_type": item["media_type"],
+    }
+
+
+def persist_items(page_items):
+    """
+    Upsert the page's media and tags in bulk so they can be revisited later.
+    In write-behind mode the page is queued for the ingest worker instead,
+    falling back to an inline write when the queue is full or unreachable.
+    """
+    results = [normalise_item(item) for item in page_items]
+    tagged_items = [(item["id"], item.get("tags") or []) for item in page_items]
+
+    if settings.SEARCH_INGEST_MODE == "write_behind":
+        try:
+            if enqueue_page(results, tagged_items):
+                return results
+            logger.warning("Ingest queue is full, writing search results inline.")
+        except Exception as e:
+            logger.error(f"Failed to queue search results, writing inline: {e}")
+
+    ingest_page(results, tagged_items)
+    return results
+
+
+def run_search(client, params):
+    """
+    Query Openverse, persist the returned page and build the response payload.
+    Raises whatever the client raises on upstream failure.
+    """
+    img_resp, aud_resp, partial = fetch_upstream(client, params)
+    page_items, total_count, total_pages = merge_results(params, img_resp, aud_resp)
+    results = persist_items(page_items)
+
+    return {
+        "results": results,
+        "page": params["page"],
+        "page_size": params["page_size"],
+        "total_count": total_count,
+        "total_pages": total_pages,
+        "partial": partial,
+        "degraded": False,
+    }
+
+
+async def arun_search(client, params):
+    """Async equivalent of run_search; persistence runs in a worker thread."""
+    img_resp, aud_resp, partial = await afetch_upstream(client, params)
+    page_items, total_count, total_pages = merge_results(params, img_resp, aud_resp)
+    results = await sync_to_async(persist_items)(page_items)
+
+    return {
+        "results": results,
+        "page": params["page"],
+        "page_size": params["page_size"],
+        "total_count": total_count,
+        "total_pages": total_pages,
+        "partial": partial,
+        "degraded": False,
+    }
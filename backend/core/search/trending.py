@@ -0,0 +1,101 @@
+# backend/core/search/trending.py
+
+import logging
+import time
+
+from django.conf import settings
+from django_redis import get_redis_connection
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "search:trending:"
+MAX_VALUE_LENGTH = 100
+
+# window -> bucket length in seconds
+WINDOWS = {"hour": 3600, "day": 86400}
+
+
+def _redis():
+    return get_redis_connection("default")
+
+
+def normalise(value):
+    """Fold case and whitespace so 'Sun  Set' and 'sun set' count together."""
+    return " ".join(value.split()).casefold()
+
+
+def _bucket_key(window, bucket):
+    return f"{KEY_PREFIX}{window}:{bucket}"
+
+
+def _view_key(window):
+    return f"{KEY_PREFIX}{window}:view"
+
+
+def record_trending(search_value, now=None):
+    """
+    Count a search into the current hour and day sorted sets in one round trip.
+    Buckets expire after two windows; their size is bounded by _build_view().
+    """
+    value = normalise(search_value)
+    if not value or len(value) > MAX_VALUE_LENGTH:
+        return
+
+    now = now or time.time()
+    pipe = _redis().pipeline(transaction=False)
+    for window, length in WINDOWS.items():
+        key = _bucket_key(window, int(now // length))
+        pipe.zincrby(key, 1, value)
+        pipe.expire(key, length * 2)
+    pipe.execute()
+
+
+def _trim_bucket(conn, key):
+    """
+    Drop the long tail of one-off queries, but only once the bucket holds twice
+    TRENDING_MAX_MEMBERS: ties at the bottom are ranked by value, so trimming
+    on every increment would keep evicting the newest terms.
+    """
+    if conn.zcard(key) > 2 * settings.TRENDING_MAX_MEMBERS:
+        conn.zremrangebyrank(key, 0, -settings.TRENDING_MAX_MEMBERS - 1)
+
+
+def _build_view(conn, window, now):
+    """
+    Decayed popularity over a sliding window: the current bucket at full weight
+    plus the previous bucket weighted by how much of it is still in the window.
+    Materialised into a short-lived sorted set shared by every worker.
+    """
+    length = WINDOWS[window]
+    bucket = int(now // length)
+    elapsed = (now % length) / length
+    view_key = _view_key(window)
+    _trim_bucket(conn, _bucket_key(window, bucket))
+
+    pipe = conn.pipeline(transaction=True)
+    pipe.zunionstore(
+        view_key,
+        {_bucket_key(window, bucket): 1.0, _bucket_key(window, bucket - 1): 1.0 - elapsed},
+    )
+    pipe.expire(view_key, settings.TRENDING_VIEW_TTL)
+    pipe.execute()
+
+
+def trending(window="hour", limit=10, now=None):
+    """
+    Top searches in the window, most popular first, as (value, score) pairs.
+    Values scoring below TRENDING_MIN_SCORE are never shown, so a query only
+    one person ran is not published.
+    """
+    conn = _redis()
+    now = now or time.time()
+    view_key = _view_key(window)
+    if not conn.exists(view_key):
+        _build_view(conn, window, now)
+
+    return [
+        (value.decode(), round(score, 2))
+        for value, score in conn.zrevrangebyscore(
+            view_key, "+inf", settings.TRENDING_MIN_SCORE, start=0, num=limit, withscores=True
+        )
+    ]
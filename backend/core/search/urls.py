@@ -1,16 +1,26 @@
 # backend/core/search/urls.py
 
+from django.conf import settings
 from django.urls import path
 from .views import (
+    AsyncSearchView,
     SearchView,
+    LocalSearchView,
+    SuggestView,
+    TrendingView,
     SearchHistoryPreviewView,
     SearchHistoryListView,
     SearchHistoryDeleteView,
     SearchHistoryClearView
 )
 
+SearchEndpoint = AsyncSearchView if settings.ASYNC_VIEWS else SearchView
+
 urlpatterns = [
-    path("", SearchView.as_view(), name="search"),
+    path("", SearchEndpoint.as_view(), name="search"),
+    path("local/", LocalSearchView.as_view(), name="search-local"),
+    path("suggest/", SuggestView.as_view(), name="search-suggest"),
+    path("trending/", TrendingView.as_view(), name="search-trending"),
     path("history/preview/", SearchHistoryPreviewView.as_view(), name="/history-preview"),
     path("history/",         SearchHistoryListView.as_view(),    name="/history-list"),
     path("history/<int:pk>/",SearchHistoryDeleteView.as_view(),  name="/history-delete"),
@@ -1,33 +1,93 @@
 # backend/core/search/views.py
 
 import logging
-from math import ceil
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.http import JsonResponse
-from django.utils import timezone
 from django.views import View
-from django.shortcuts import get_object_or_404
 from rest_framework import generics, permissions, status
 from rest_framework.views import APIView
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from rest_framework.authentication import SessionAuthentication, BasicAuthentication
+from rest_framework.exceptions import AuthenticationFailed
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
-from core.openverse_client import OpenverseClient
-from core.media.models.media import Media
-from core.media.models.tag import Tag, MediaTag
+from core.http_cache import cache_response
+from core.media.favourites import mark_favourites
+from core.pagination import KeysetPagination
+from core.circuit_breaker import CircuitOpenError
+from core.openverse_client import (
+    AsyncOpenverseClient,
+    OpenverseClient,
+    OpenverseError,
+    is_upstream_failure,
+)
+from .cache import aget_or_fetch, get_or_fetch
+from .history import record_search
+from .local import fulltext_search, local_search, suggest
+from .trending import WINDOWS, record_trending, trending
 from .models import SearchHistory
 from .serializer import SearchHistorySerializer
+from .services import arun_search, parse_search_params, run_search
 
 logger = logging.getLogger(__name__)
 
-TAG_ACCURACY_THRESHOLD = 0.5
+
+def cache_search_response(response, payload, authenticated):
+    """
+    Cache headers for a search response. Authenticated searches are recorded in
+    the user's history, so shared caches must not answer them; partial and
+    degraded results are revalidated on every use rather than held for max-age.
+    """
+    if authenticated:
+        return cache_response(response, private=True)
+    if payload.get("partial") or payload.get("degraded"):
+        return cache_response(response, max_age=0)
+    return cache_response(response)
+
+
+def count_trending(search_value, page):
+    """Count a new search (not a pagination click) towards trending searches."""
+    if page > 1:
+        return
+    try:
+        record_trending(search_value)
+    except Exception as e:
+        logger.warning(f"Failed to count trending search '{search_value}': {e}")
+
+
+def can_degrade(exc):
+    """Whether a failed search should be answered from ingested media instead."""
+    return isinstance(exc, CircuitOpenError) or is_upstream_failure(exc)
+
+
+# Openverse statuses meaning the search itself was rejected, not our credentials
+QUERY_REJECTED_STATUSES = (400, 404, 422)
+
+
+def upstream_error_response(exc):
+    """
+    Response for an Openverse error that cannot be degraded; re-raises anything else.
+    Only query rejections surface as 400. Credential and other upstream errors
+    become 502/503 so clients never read them as a problem with their own token,
+    and the upstream body is logged rather than returned.
+    """
+    if not isinstance(exc, OpenverseError) or exc.status_code is None:
+        raise exc
+    logger.error(f"Openverse rejected search: {exc}")
+    if exc.status_code in QUERY_REJECTED_STATUSES:
+        return JsonResponse({"error": "Openverse rejected the search query."}, status=400)
+    if exc.status_code == 429 or exc.status_code >= 500:
+        return JsonResponse({"error": "Openverse is unavailable."}, status=503)
+    return JsonResponse({"error": "Error fetching data from Openverse."}, status=502)
+
 
 class SearchView(APIView):
     """
     GET /api/search/?q=foo
     Hits both images and audio endpoints, merges and returns a flat list.
+    While Openverse is unavailable, results come from ingested media with degraded=True.
     """
     
     authentication_classes = [
@@ -41,201 +101,213 @@ class SearchView(APIView):
     client = OpenverseClient()
 
     def get(self, request):
-        # Get the search key and value from the request
-        SEARCH_KEYS = ["q", "title", "tag", "creator"]
-        search_key = next((k for k in SEARCH_KEYS if k in request.GET), "q")
-        search_value = request.GET.get(search_key, "").strip()
-        
-        page = max(int(request.GET.get("page", 1)), 1)
-        page_size = max(int(request.GET.get("page_size", 18)), 1)
-        
-        # Get media_type and mature flags
-        media_type = request.GET.get("media_type", "image").lower()
-        mature = request.GET.get("mature", "false").lower() == "true"
-        
-        # Get sort parameters
-        sort_by = request.GET.get("sort_by", "relevance").lower()
-        sort_dir = request.GET.get("sort_dir", "desc").lower()
-        
-        # Get filter parameters, split list by comma
-        source_list = [
-            s.strip() for s in request.GET.get("source", "").split(",")
-            if s.strip()
-        ]
-        license_list = [
-            l.strip() for l in request.GET.get("license", "").split(",")
-            if l.strip()
-        ]
-        extension_list = [
-            e.strip() for e in request.GET.get("extension", "").split(",")
-            if e.strip()
-        ]
+        params = parse_search_params(request.GET)
+        search_key = params["search_key"]
+        search_value = params["search_value"]
 
         if not search_value:
             logger.warning("Search value is empty, returning 400 response.")
             return JsonResponse({"results": []}, status=400)
 
-        logger.info(f"Received search: {search_key}='{search_value}', page: {page}, page_size: {page_size}")
+        logger.info(
+            f"Received search: {search_key}='{search_value}', "
+            f"page: {params['page']}, page_size: {params['page_size']}"
+        )
         
         # Save to search history
         if request.user.is_authenticated:
-            SearchHistory.objects.create(user=request.user, search_key=search_key, search_value=search_value)
-            logger.info(f"Saved search history for user {request.user.id}: {search_value}")
+            try:
+                record_search(request.user, search_key, search_value, params["page"])
+            except Exception as e:
+                logger.error(f"Failed to save search history for user {request.user.id}: {e}")
+            else:
+                logger.info(f"Saved search history for user {request.user.id}: {search_value}")
         else:
             logger.info("Anonymous user, not saving search history.")
 
-        # Fetch results from both endpoints
-        params = {
-            search_key: search_value,
-            "page": page,
-            "per_page": page_size,
-            "unstable__include_sensitive_results": mature,
-            "unstable__sort_by": sort_by,
-            "unstable__sort_dir": sort_dir,
-        }
-        
-        # Add optional parameters if provided
-        if source_list:
-            params["source"] = ",".join(source_list)
-        if license_list:
-            params["license"] = ",".join(license_list)
-        if extension_list:
-            params["extension"] = ",".join(extension_list)
-        
-        # Log the parameters being sent to Openverse
-        logger.debug(f"Parameters: {params}")
-        
-        # Only hit the endpoint the user wants
+        count_trending(search_value, params["page"])
+
+        # Serve from the result cache, falling back to Openverse on a miss
+        try:
+            payload = get_or_fetch(params, lambda: run_search(self.client, params))
+        except Exception as e:
+            if not can_degrade(e):
+                return upstream_error_response(e)
+            # Openverse is down or the breaker is open: answer from ingested media
+            logger.error(f"Error while querying Openverse: {e}")
+            try:
+                payload = local_search(params)
+            except Exception as local_error:
+                logger.error(f"Degraded local search failed: {local_error}")
+                return JsonResponse({"error": "Error fetching data from Openverse."}, status=500)
+
+        # Saves the results grid a favourite-status request per item
+        if request.user.is_authenticated:
+            payload = mark_favourites(request.user, payload)
+
+        logger.info(
+            f"Search complete for {search_key}'{search_value}' "
+            f"with {len(payload['results'])} results."
+        )
+
+        return cache_search_response(Response(payload), payload, request.user.is_authenticated)
+
+
+async def aget_user(request):
+    """
+    Resolve the JWT or session user for an async view without blocking the loop.
+    Returns None for anonymous requests and raises AuthenticationFailed for bad tokens.
+    """
+    auth = await sync_to_async(JWTAuthentication().authenticate)(request)
+    if auth is not None:
+        return auth[0]
+    user = await request.auser()
+    return user if user.is_authenticated else None
+
+
+class AsyncSearchView(View):
+    """
+    GET /api/search/?q=foo
+    Async version of SearchView served under the ASGI profile. Upstream calls
+    are awaited, so one worker can keep many searches in flight.
+    """
+
+    client = AsyncOpenverseClient()
+
+    async def get(self, request):
+        params = parse_search_params(request.GET)
+        search_key = params["search_key"]
+        search_value = params["search_value"]
+
+        if not search_value:
+            logger.warning("Search value is empty, returning 400 response.")
+            return JsonResponse({"results": []}, status=400)
+
         try:
-            if media_type == "image":
-                img_resp = self.client.query("images", params={**params})
-                aud_resp = {"results": [], "result_count": 0}
-            elif media_type == "audio":
-                img_resp = {"results": [], "result_count": 0}
-                aud_resp = self.client.query("audio", params={**params})
+            user = await aget_user(request)
+        except AuthenticationFailed as e:
+            return JsonResponse({"detail": str(e.detail)}, status=401)
+
+        logger.info(
+            f"Received async search: {search_key}='{search_value}', "
+            f"page: {params['page']}, page_size: {params['page_size']}"
+        )
+
+        # Save to search history
+        if user is not None:
+            try:
+                await sync_to_async(record_search)(user, search_key, search_value, params["page"])
+            except Exception as e:
+                logger.error(f"Failed to save search history for user {user.id}: {e}")
             else:
-                img_resp = self.client.query("images", params={**params})
-                aud_resp = self.client.query("audio", params={**params})
+                logger.info(f"Saved search history for user {user.id}: {search_value}")
+
+        await sync_to_async(count_trending)(search_value, params["page"])
+
+        # Serve from the result cache, falling back to Openverse on a miss
+        try:
+            payload = await aget_or_fetch(params, lambda: arun_search(self.client, params))
         except Exception as e:
+            if not can_degrade(e):
+                return upstream_error_response(e)
+            # Openverse is down or the breaker is open: answer from ingested media
             logger.error(f"Error while querying Openverse: {e}")
-            return JsonResponse({"error": "Error fetching data from Openverse."}, status=500)
-
-        # Log response data for debugging
-        #logger.debug(f"Image response: {img_resp}")
-        #logger.debug(f"Audio response: {aud_resp}")
-        for kind, resp in (("img", img_resp), ("aud", aud_resp)):
-            results = resp.get("results", [])
-            logger.debug(f"{kind}_resp returned {len(results)} results")
-            if results:
-                logger.debug("%s_resp keys: %s", kind, list(results[0].keys()))
-
-        # Sum the totals
-        img_total = img_resp.get("result_count", len(img_resp.get("results", [])))
-        aud_total = aud_resp.get("result_count", len(aud_resp.get("results", [])))
-        total_count = img_total + aud_total
-        total_pages = ceil(total_count / page_size)
-
-        # Log total count and pages
-        logger.info(f"Total results: {total_count}, Total pages: {total_pages}")
-
-        # Process image and audio items and add media_type and mature flags
-        img_items = []
-        for item in img_resp.get("results", []):
-            item["media_type"] = "image"
-            is_sensitive = bool(item.get("mature")) or bool(item.get("unstable__sensitivity"))
-            item["mature"] = is_sensitive
-            img_items.append(item)
-
-        aud_items = []
-        for item in aud_resp.get("results", []):
-            item["media_type"] = "audio"
-            is_sensitive = bool(item.get("mature")) or bool(item.get("unstable__sensitivity"))
-            item["mature"] = is_sensitive
-            aud_items.append(item)
-            
-        # Merge the two lists respecting the sort order
-        if sort_by == "relevance":
-            # Interleave
-            merged = []
-            # zip_longest from itertools handles uneven lists
-            from itertools import zip_longest
-            for img, aud in zip_longest(img_items, aud_items, fillvalue=None):
-                if img: merged.append(img)
-                if aud: merged.append(aud)
-        else:
-            # Timestamp or other global sort
-            merged = sorted(
-                img_items + aud_items,
-                key=lambda i: i.get(sort_by) or "indexed_on",
-                reverse=(sort_dir == "desc")
-            )
+            try:
+                payload = await sync_to_async(local_search)(params)
+            except Exception as local_error:
+                logger.error(f"Degraded local search failed: {local_error}")
+                return JsonResponse({"error": "Error fetching data from Openverse."}, status=500)
+
+        # Saves the results grid a favourite-status request per item
+        if user is not None:
+            payload = await sync_to_async(mark_favourites)(user, payload)
+
+        logger.info(
+            f"Search complete for {search_key}'{search_value}' "
+            f"with {len(payload['results'])} results."
+        )
+
+        return cache_search_response(JsonResponse(payload), payload, user is not None)
+
+
+class LocalSearchView(APIView):
+    """
+    GET /api/search/local/?q=foo
+    Full-text search over ingested media without going upstream. Accepts the
+    same search keys, filters, sort and pagination parameters as SearchView.
+    """
+
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        params = parse_search_params(request.GET)
+        if not params["search_value"]:
+            return JsonResponse({"results": []}, status=400)
+
+        return Response(fulltext_search(params))
+
 
-        # Slice for this page
-        start = (page - 1) * page_size
-        end = start + page_size
-        page_items = merged[start:end]
-
-        # Log the number of items being returned for this page
-        logger.info(f"Returning {len(page_items)} items for page {page}.")
-
-        # Upset and build the flat dict
-        results = []
-        for item in page_items:
-            data = {
-                "openverse_id": item["id"],
-                "title": item.get("title"),
-                "indexed_on": item.get("indexed_on") or timezone.now().isoformat(),
-                "foreign_landing_url": item.get("foreign_landing_url"),
-                "url": item.get("url"),
-                "creator": item.get("creator"),
-                "creator_url": item.get("creator_url"),
-                "license": item.get("license"),
-                "license_version": item.get("license_version"),
-                "license_url": item.get("license_url"),
-                "attribution": item.get("attribution"),
-                "source": item.get("source"),
-                "category": item.get("category"),
-                "file_size": item.get("filesize"),
-                "file_type": item.get("filetype"),
-                "mature": item["mature"],
-                "thumbnail_url": item.get("thumbnail"),
-                "height": item.get("height"),
-                "width": item.get("width"),
-                "duration": item.get("duration"),
-                "media_type": item["media_type"],
-            }
-            # Log upsert action
-            logger.debug(f"Upserting media item: {data['openverse_id']}")
-
-            # Upsert so you can revisit later
-            Media.objects.update_or_create(openverse_id=data["openverse_id"], defaults=data)
-            results.append(data)
-            
-            # Get the media object to associate tags
-            media = get_object_or_404(Media, openverse_id=data["openverse_id"])
-            
-            # Upsert tags for the media item
-            for tag_dict in item.get("tags", []):
-                name = tag_dict.get("name")
-                accuracy = tag_dict.get("accuracy")
-                # Only keep tags with a defined accuracy >= threshold
-                if name and isinstance(accuracy, (int, float)) and accuracy >= TAG_ACCURACY_THRESHOLD:
-                    tag_obj, _ = Tag.objects.get_or_create(name=name)
-                    MediaTag.objects.get_or_create(media=media, tag=tag_obj, defaults={"accuracy": accuracy})
-
-        logger.info(f"Search complete for {search_key}'{search_value}' with {len(results)} results.")
+class SuggestView(APIView):
+    """
+    GET /api/search/suggest/?q=fo&field=title&limit=10
+    Fuzzy typeahead over ingested titles or creators, best matches first.
+    """
+
+    permission_classes = [AllowAny]
+    max_limit = 25
+
+    def get(self, request):
+        field = request.GET.get("field", "title").lower()
+        if field not in ("title", "creator"):
+            return Response(
+                {"detail": "field must be 'title' or 'creator'"}, status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            limit = min(max(int(request.GET.get("limit", 10)), 1), self.max_limit)
+        except ValueError:
+            limit = 10
 
         return Response(
-            {
-                "results": results,
-                "page": page,
-                "page_size": page_size,
-                "total_count": total_count,
-                "total_pages": total_pages,
-            }
+            {"field": field, "results": suggest(request.GET.get("q", ""), field, limit)}
         )
 
-class SearchHistoryPagination(PageNumberPagination):
+
+class TrendingView(APIView):
+    """
+    GET /api/search/trending/?window=hour&limit=10
+    Most searched values over the last hour or day, from Redis sorted sets.
+    """
+
+    permission_classes = [AllowAny]
+    max_limit = 50
+
+    def get(self, request):
+        window = request.GET.get("window", "hour")
+        if window not in WINDOWS:
+            return Response(
+                {"detail": "window must be 'hour' or 'day'"}, status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            limit = min(max(int(request.GET.get("limit", 10)), 1), self.max_limit)
+        except ValueError:
+            limit = 10
+
+        try:
+            results = trending(window, limit)
+        except Exception as e:
+            logger.error(f"Failed to read trending searches: {e}")
+            return Response(
+                {"window": window, "results": []}, status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+
+        payload = {
+            "window": window,
+            "results": [{"value": v, "score": score} for v, score in results],
+        }
+        return cache_response(Response(payload), max_age=settings.TRENDING_VIEW_TTL)
+
+class SearchHistoryPagination(KeysetPagination):
+    ordering_field = 'searched_at'
     page_size = 50
     page_size_query_param = 'page_size'
     max_page_size = 100
@@ -249,12 +321,15 @@ class SearchHistoryPreviewView(generics.ListAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        return SearchHistory.objects.filter(user=self.request.user)[:5]
+        # Top 5 straight off the (user, searched_at, id) index
+        queryset = SearchHistory.objects.filter(user=self.request.user)
+        return queryset.order_by('-searched_at', '-id')[:5]
 
 class SearchHistoryListView(generics.ListAPIView):
     """
-    GET /api/search/history/?page=1&page_size=24
-    Paginated list of all searches for the authenticated user.
+    GET /api/search/history/?cursor=...&page_size=24[&count=true]
+    Cursor-paginated list of all searches for the authenticated user, newest first.
+    ?page= is still accepted.
     """
     serializer_class = SearchHistorySerializer
     permission_classes = [permissions.IsAuthenticated]
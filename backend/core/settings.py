@@ -38,6 +38,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "corsheaders",
     "rest_framework",
     # APP_DIRS
@@ -49,7 +50,11 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    # Outermost after security, so it logs the final status (e.g. 304s)
+    "core.analytics.middleware.APIRequestLoggingMiddleware",
+    "core.analytics.middleware.RequestMetricsMiddleware",
     "corsheaders.middleware.CorsMiddleware",
+    "django.middleware.http.ConditionalGetMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -95,6 +100,12 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = "core.wsgi.application"
+ASGI_APPLICATION = "core.asgi.application"
+
+# "wsgi" runs sync gunicorn workers, "asgi" runs uvicorn workers and serves
+# the async search and media detail views
+SERVER_PROFILE = os.getenv("DJANGO_SERVER_PROFILE", "wsgi")
+ASYNC_VIEWS = SERVER_PROFILE == "asgi"
 
 # Database Configuration
 # Check if we are on Heroku
@@ -190,6 +201,22 @@ OPENVERSE_API_URL = os.getenv("OPENVERSE_API_URL", "https://api.openverse.org/v1
 OPENVERSE_CLIENT_ID = os.getenv("OPENVERSE_CLIENT_ID", "your_openverse_client_id")
 OPENVERSE_CLIENT_SECRET = os.getenv("OPENVERSE_CLIENT_SECRET", "your_openverse_client_secret")
 
+# Openverse HTTP transport (per-process keep-alive pool)
+OPENVERSE_POOL_CONNECTIONS = int(os.getenv("OPENVERSE_POOL_CONNECTIONS", "4"))  # pooled hosts
+OPENVERSE_POOL_MAXSIZE = int(os.getenv("OPENVERSE_POOL_MAXSIZE", "16"))  # sockets per host
+OPENVERSE_CONNECT_TIMEOUT = float(os.getenv("OPENVERSE_CONNECT_TIMEOUT", "3.05"))
+OPENVERSE_READ_TIMEOUT = float(os.getenv("OPENVERSE_READ_TIMEOUT", "10"))
+OPENVERSE_MAX_RETRIES = int(os.getenv("OPENVERSE_MAX_RETRIES", "2"))
+OPENVERSE_RETRY_BACKOFF = float(os.getenv("OPENVERSE_RETRY_BACKOFF", "0.25"))
+OPENVERSE_RETRY_JITTER = float(os.getenv("OPENVERSE_RETRY_JITTER", "0.25"))
+OPENVERSE_MAX_RETRY_AFTER = float(os.getenv("OPENVERSE_MAX_RETRY_AFTER", "2"))  # seconds
+# Circuit breaker around Openverse queries, shared across workers through Redis
+OPENVERSE_BREAKER_FAILURES = int(os.getenv("OPENVERSE_BREAKER_FAILURES", "5"))  # to open
+OPENVERSE_BREAKER_WINDOW = int(os.getenv("OPENVERSE_BREAKER_WINDOW", "30"))  # seconds
+OPENVERSE_BREAKER_RECOVERY = int(os.getenv("OPENVERSE_BREAKER_RECOVERY", "30"))  # seconds open
+# In-flight upstream requests per ASGI worker
+OPENVERSE_ASYNC_MAX_CONNECTIONS = int(os.getenv("OPENVERSE_ASYNC_MAX_CONNECTIONS", "500"))
+
 # Redis settings
 REDISCLOUD_URL = os.getenv("REDISCLOUD_URL", "redis://localhost:6379/1")
 redis_parsed = urllib.parse.urlparse(REDISCLOUD_URL)
@@ -205,6 +232,63 @@ CACHES = {
     }
 }
 
+# Search result cache settings
+# seconds an entry is fresh, 0 disables
+SEARCH_CACHE_TTL = int(os.getenv("SEARCH_CACHE_TTL", "300"))
+SEARCH_CACHE_STALE_TTL = int(os.getenv("SEARCH_CACHE_STALE_TTL", "3600"))  # seconds served stale
+
+# Postgres text search configuration for the local Media search index
+SEARCH_TEXT_CONFIG = os.getenv("SEARCH_TEXT_CONFIG", "english")
+
+# Concurrent image/audio fan-out for merged searches
+SEARCH_FANOUT_WORKERS = int(os.getenv("SEARCH_FANOUT_WORKERS", "8"))
+SEARCH_FANOUT_TIMEOUT = float(os.getenv("SEARCH_FANOUT_TIMEOUT", "10"))  # shared deadline, seconds
+
+# Search result persistence: "inline" writes during the request, "write_behind" queues
+# pages in Redis for `manage.py ingest_worker`
+SEARCH_INGEST_MODE = os.getenv("SEARCH_INGEST_MODE", "inline")
+INGEST_BATCH_SIZE = int(os.getenv("INGEST_BATCH_SIZE", "20"))  # pages per worker batch
+INGEST_FLUSH_INTERVAL = float(os.getenv("INGEST_FLUSH_INTERVAL", "1"))  # seconds
+INGEST_QUEUE_MAX_LENGTH = int(os.getenv("INGEST_QUEUE_MAX_LENGTH", "10000"))  # pages
+
+# Media detail accesses are counted in Redis and flushed by `manage.py flush_media_access`
+MEDIA_ACCESS_FLUSH_BATCH_SIZE = int(os.getenv("MEDIA_ACCESS_FLUSH_BATCH_SIZE", "1000"))
+
+# Search history: "inline" writes during the request, "buffered" queues searches in
+# Redis for `manage.py flush_search_history`
+SEARCH_HISTORY_WRITE_MODE = os.getenv("SEARCH_HISTORY_WRITE_MODE", "inline")
+SEARCH_HISTORY_MAX_PER_USER = int(os.getenv("SEARCH_HISTORY_MAX_PER_USER", "500"))  # rows kept
+# Seconds between the history worker's sweeps enforcing the cap for every user
+SEARCH_HISTORY_TRIM_INTERVAL = float(os.getenv("SEARCH_HISTORY_TRIM_INTERVAL", "3600"))
+
+# Tag autocomplete results are cached per prefix
+TAG_AUTOCOMPLETE_CACHE_TTL = int(os.getenv("TAG_AUTOCOMPLETE_CACHE_TTL", "600"))  # seconds
+
+# The source filter list is read from the media_sources summary and cached
+SOURCE_LIST_CACHE_TTL = int(os.getenv("SOURCE_LIST_CACHE_TTL", "300"))  # seconds
+
+# API request logging: rows are buffered in-process and bulk inserted by a background thread
+ANALYTICS_LOG_REQUESTS = os.getenv("ANALYTICS_LOG_REQUESTS", "true").lower() == "true"
+ANALYTICS_LOG_PATH_PREFIX = os.getenv("ANALYTICS_LOG_PATH_PREFIX", "/api/")
+ANALYTICS_BUFFER_SIZE = int(os.getenv("ANALYTICS_BUFFER_SIZE", "10000"))  # rows queued per process
+ANALYTICS_FLUSH_INTERVAL = float(os.getenv("ANALYTICS_FLUSH_INTERVAL", "2"))  # seconds
+ANALYTICS_FLUSH_BATCH_SIZE = int(os.getenv("ANALYTICS_FLUSH_BATCH_SIZE", "500"))  # rows per INSERT
+
+# Metrics are summed per process and flushed to Redis for /api/analytics/metrics/
+METRICS_FLUSH_INTERVAL = float(os.getenv("METRICS_FLUSH_INTERVAL", "5"))  # seconds
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")  # bearer token for scrapers; staff only if unset
+
+# Trending searches: per hour/day Redis sorted sets, read through a shared decayed view
+# Values kept per bucket, trimmed once the set grows to twice this
+TRENDING_MAX_MEMBERS = int(os.getenv("TRENDING_MAX_MEMBERS", "10000"))
+TRENDING_VIEW_TTL = int(os.getenv("TRENDING_VIEW_TTL", "30"))  # seconds
+# Decayed search count a value needs before it is shown
+TRENDING_MIN_SCORE = float(os.getenv("TRENDING_MIN_SCORE", "3"))
+
+# Conditional GET: Cache-Control max-age for anonymous, cacheable responses
+HTTP_CACHE_MAX_AGE = int(os.getenv("HTTP_CACHE_MAX_AGE", "60"))  # seconds
+HTTP_CACHE_LIST_MAX_AGE = int(os.getenv("HTTP_CACHE_LIST_MAX_AGE", "300"))  # tag/source lists
+
 # Logging settings
 
 LOGGING = {
@@ -2,8 +2,14 @@
 
 from django.http import JsonResponse
 
+from core.analytics.buffer import buffer as request_log
+from core.openverse_client import pool_stats
+
 def health_check(request):
     """
     Health check endpoint to verify that the server is running.
+    Also reports this worker's Openverse connection pool and request log statistics.
     """
-    return JsonResponse({"status": "ok"})
+    return JsonResponse(
+        {"status": "ok", "openverse_pool": pool_stats(), "request_log": request_log.stats()}
+    )
@@ -10,5 +10,9 @@ python manage.py migrate
 # Collect static files
 python manage.py collectstatic --noinput
 
-# Start Django application with Gunicorn
-gunicorn core.wsgi:application --bind 0.0.0.0:8000
+# Start Django application with Gunicorn, using uvicorn workers for the ASGI profile
+if [ "$DJANGO_SERVER_PROFILE" = "asgi" ]; then
+    gunicorn core.asgi:application --bind 0.0.0.0:8000 -k uvicorn.workers.UvicornWorker
+else
+    gunicorn core.wsgi:application --bind 0.0.0.0:8000
+fi
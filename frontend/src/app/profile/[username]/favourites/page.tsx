@@ -6,7 +6,7 @@ import FavouritesInner from '@/components/profile/FavouritesInner'
 
 interface FavouritesPageProps {
   params: Promise<{ username: string }>
-  searchParams: Promise<{ page?: string; page_size?: string }>
+  searchParams: Promise<{ cursor?: string; page_size?: string }>
 }
 
 export const generateMetadata = async ({ params }: FavouritesPageProps): Promise<Metadata> => {
@@ -20,14 +20,13 @@ export const generateMetadata = async ({ params }: FavouritesPageProps): Promise
 
 const FavouritesPage = async ({ params, searchParams }: FavouritesPageProps) => {
   const { username } = await params
-  const { page: rawPage, page_size: rawPageSize } = await searchParams
+  const { cursor, page_size: rawPageSize } = await searchParams
 
-  const page = Math.max(Number(rawPage ?? '1'), 1)
   const pageSize = Math.max(Number(rawPageSize ?? '18'), 1)
 
   return (
     <ClientOnly>
-      <FavouritesInner username={username} page={page} pageSize={pageSize} />
+      <FavouritesInner username={username} cursor={cursor ?? null} pageSize={pageSize} />
     </ClientOnly>
   )
 }
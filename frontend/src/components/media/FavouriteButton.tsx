@@ -10,22 +10,33 @@ import { isMediaFavourite, addMediaFavourite, removeMediaFavourite } from '@/lib
 
 interface FavouriteButtonProps {
   mediaId: string
+  // Known status, e.g. is_favourite from search results; fetched when omitted
+  initialFavourite?: boolean
   size?: number
   onToggle?: (nowFavourite: boolean) => void
 }
 
-const FavouriteButton = ({ mediaId, size = 24, onToggle }: FavouriteButtonProps) => {
+const FavouriteButton = ({
+  mediaId,
+  initialFavourite,
+  size = 24,
+  onToggle,
+}: FavouriteButtonProps) => {
   const router = useRouter()
   const { authFetch: rawAuthFetch, user: me } = useAuth()
-  const [isFav, setIsFav] = useState(false)
+  const [isFav, setIsFav] = useState(initialFavourite ?? false)
 
   // Wrap authFetch for fetcher
   const authFetch = (input: RequestInfo | URL, init?: RequestInit) =>
     rawAuthFetch(input.toString(), init)
   const fetcher = me ? authFetch : fetch
 
-  // Check if media is favourited on mount or when user changes
+  // Check if media is favourited on mount or when user changes, unless already known
   useEffect(() => {
+    if (initialFavourite !== undefined) {
+      setIsFav(initialFavourite)
+      return
+    }
     let mounted = true
     ;(async () => {
       try {
@@ -38,7 +49,7 @@ const FavouriteButton = ({ mediaId, size = 24, onToggle }: FavouriteButtonProps)
     return () => {
       mounted = false
     }
-  }, [mediaId, me])
+  }, [mediaId, me, initialFavourite])
 
   const toggleFav = async () => {
     try {
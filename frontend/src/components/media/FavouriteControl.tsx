@@ -8,6 +8,7 @@ import FavouriteButton from '@/components/media/FavouriteButton'
 interface FavouriteControlProps {
   mediaId: string
   initialCount: number
+  initialFavourite?: boolean
   size?: number
   requireHover?: boolean
 }
@@ -15,6 +16,7 @@ interface FavouriteControlProps {
 export const FavouriteControl = ({
   mediaId,
   initialCount,
+  initialFavourite,
   size = 24,
   requireHover = false,
 }: FavouriteControlProps) => {
@@ -39,7 +41,12 @@ export const FavouriteControl = ({
         onMouseEnter={() => requireHover && setHovering(true)}
         onMouseLeave={() => requireHover && setHovering(false)}
       >
-        <FavouriteButton mediaId={mediaId} size={size} onToggle={handleToggle} />
+        <FavouriteButton
+          mediaId={mediaId}
+          initialFavourite={initialFavourite}
+          size={size}
+          onToggle={handleToggle}
+        />
       </div>
     </div>
   )
@@ -76,6 +76,7 @@ const MediaCard = ({ media, mini = false }: MediaCardProps) => {
             <FavouriteControl
               mediaId={media.openverse_id}
               initialCount={media.favourites_count ?? 0}
+              initialFavourite={media.is_favourite}
               size={24}
               requireHover={true}
             />
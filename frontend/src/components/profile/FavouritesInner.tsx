@@ -10,22 +10,23 @@ import type { User } from '@/lib/profile/types'
 import type { Media } from '@/lib/media/types'
 import { getUserProfile, getUserFavs } from '@/lib/profile/api'
 import MediaCard from '@/components/media/MediaCard'
-import PageNavigator from '@/components/shared/PageNavigator'
+import { nextCursor } from '@/lib/pagination'
+import CursorNavigator from '@/components/shared/CursorNavigator'
 import PrivateProfile from '@/components/profile/PrivateProfile'
 import LoadingSpinner from '@/components/shared/LoadingSpinner'
 
 export interface FavouritesInnerProps {
   username: string
-  page: number
+  cursor: string | null
   pageSize: number
 }
 
-const FavouritesInner = ({ username, page, pageSize }: FavouritesInnerProps) => {
+const FavouritesInner = ({ username, cursor, pageSize }: FavouritesInnerProps) => {
   const [loading, setLoading] = useState(true)
   const [isPrivate, setIsPrivate] = useState(false)
   const [profile, setProfile] = useState<User | null>(null)
   const [mediaList, setMediaList] = useState<Media[]>([])
-  const [totalPages, setTotalPages] = useState(1)
+  const [next, setNext] = useState<string | null>(null)
 
   const { authFetch: rawAuthFetch, user: me } = useAuth()
 
@@ -49,10 +50,10 @@ const FavouritesInner = ({ username, page, pageSize }: FavouritesInnerProps) =>
           return
         }
 
-        const favs = await getUserFavs(fetcher, username, page, pageSize)
+        const favs = await getUserFavs(fetcher, username, pageSize, cursor)
         if (!cancelled) {
           setMediaList(favs.results.map((r) => r.media))
-          setTotalPages(Math.ceil(favs.count / pageSize))
+          setNext(nextCursor(favs.next))
         }
       } catch {
         notFound()
@@ -64,7 +65,7 @@ const FavouritesInner = ({ username, page, pageSize }: FavouritesInnerProps) =>
     return () => {
       cancelled = true
     }
-  }, [username, page, pageSize, rawAuthFetch, me])
+  }, [username, cursor, pageSize, rawAuthFetch, me])
 
   if (loading) {
     return <LoadingSpinner />
@@ -90,10 +91,10 @@ const FavouritesInner = ({ username, page, pageSize }: FavouritesInnerProps) =>
           <MediaCard key={media.openverse_id} media={media} />
         ))}
       </div>
-      <PageNavigator
+      <CursorNavigator
         basePath={`/profile/${username}/favourites`}
-        page={page}
-        totalPages={totalPages}
+        cursor={cursor}
+        nextCursor={next}
         pageSize={pageSize}
       />
     </>
@@ -39,7 +39,7 @@ const ProfileInner = ({ username }: ProfileInnerProps) => {
         if (!prof && !privateFlag) return notFound()
 
         if (!privateFlag) {
-          const firstPage = await getUserFavs(fetcher, username, 1, 6)
+          const firstPage = await getUserFavs(fetcher, username, 6)
           setMediaList(firstPage.results.map((item) => item.media))
         }
 
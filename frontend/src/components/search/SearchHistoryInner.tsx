@@ -11,7 +11,8 @@ import {
   deleteSearchHistoryEntry,
   clearSearchHistory,
 } from '@/lib/search/api'
-import PageNavigator from '@/components/shared/PageNavigator'
+import { nextCursor } from '@/lib/pagination'
+import CursorNavigator from '@/components/shared/CursorNavigator'
 
 interface HistoryItem {
   id: number
@@ -22,14 +23,13 @@ interface HistoryItem {
 
 const SearchHistoryInner = () => {
   const [items, setItems] = useState<HistoryItem[]>([])
-  const [totalPages, setTotalPages] = useState(1)
+  const [next, setNext] = useState<string | null>(null)
   const router = useRouter()
 
   const searchParams = useSearchParams()
-  const rawPage = searchParams.get('page')
+  const cursor = searchParams.get('cursor')
   const rawPageSize = searchParams.get('page_size')
 
-  const page = Math.max(Number(rawPage ?? '1'), 1)
   const pageSize = Math.max(Number(rawPageSize ?? '50'), 1)
 
   const { authFetch: rawAuthFetch, isLoggedIn } = useAuth()
@@ -38,29 +38,29 @@ const SearchHistoryInner = () => {
   const authFetch = (input: RequestInfo | URL, init?: RequestInit) =>
     rawAuthFetch(input.toString(), init)
 
-  const load = (p: number) => {
+  const load = (from: string | null) => {
     if (!isLoggedIn) return
-    fetchSearchHistoryList(authFetch, p, pageSize)
+    fetchSearchHistoryList(authFetch, pageSize, from)
       .then((data) => {
         setItems(data.results)
-        setTotalPages(Math.ceil(data.count / pageSize))
+        setNext(nextCursor(data.next))
       })
       .catch(console.error)
   }
 
   useEffect(() => {
-    load(page)
-  }, [page, isLoggedIn])
+    load(cursor)
+  }, [cursor, isLoggedIn])
 
   const onDelete = (id: number) => {
     deleteSearchHistoryEntry(authFetch, id)
-      .then(() => load(page))
+      .then(() => load(cursor))
       .catch(console.error)
   }
 
   const onClear = () => {
     clearSearchHistory(authFetch)
-      .then(() => load(1))
+      .then(() => load(null))
       .catch(console.error)
   }
 
@@ -125,10 +125,10 @@ const SearchHistoryInner = () => {
       ) : (
         <p className="text-gray-500">No recent searches.</p>
       )}
-      <PageNavigator
+      <CursorNavigator
         basePath={'/search-history'}
-        page={page}
-        totalPages={totalPages}
+        cursor={cursor}
+        nextCursor={next}
         pageSize={pageSize}
       />
     </div>
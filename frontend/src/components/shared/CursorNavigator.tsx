@@ -0,0 +1,54 @@
+// src/components/shared/CursorNavigator.tsx
+
+'use client'
+
+import { useRouter, useSearchParams } from 'next/navigation'
+import React from 'react'
+
+interface CursorNavigatorProps {
+  basePath: string
+  cursor: string | null
+  nextCursor: string | null
+  pageSize: number
+}
+
+// Newest/Next navigation for keyset-paginated lists, which have no page numbers
+const CursorNavigator = ({ basePath, cursor, nextCursor, pageSize }: CursorNavigatorProps) => {
+  const router = useRouter()
+  const params = useSearchParams()
+
+  const changePage = (to: string | null) => {
+    const qp = new URLSearchParams(params.toString())
+    qp.delete('page')
+    if (to) {
+      qp.set('cursor', to)
+    } else {
+      qp.delete('cursor')
+    }
+    qp.set('page_size', String(pageSize))
+    router.push(`${basePath}?${qp.toString()}`)
+  }
+
+  return (
+    <div className="flex justify-center items-center space-x-4 my-8">
+      <button
+        data-cy="first-page"
+        onClick={() => changePage(null)}
+        disabled={!cursor}
+        className="px-4 py-2 bg-gray-700 rounded disabled:opacity-50"
+      >
+        Newest
+      </button>
+      <button
+        data-cy="next-page"
+        onClick={() => changePage(nextCursor)}
+        disabled={!nextCursor}
+        className="px-4 py-2 bg-gray-700 rounded disabled:opacity-50"
+      >
+        Next
+      </button>
+    </div>
+  )
+}
+
+export default CursorNavigator
@@ -0,0 +1,7 @@
+// src/lib/pagination.ts
+
+// Cursor of the following page, taken from a keyset-paginated response's `next` link
+export const nextCursor = (next: string | null): string | null => {
+  if (!next) return null
+  return new URL(next, 'http://localhost').searchParams.get('cursor')
+}
@@ -18,16 +18,16 @@ export const getUserProfile = async (
   return { private: false, profile: data } as const
 }
 
-// GET /api/accounts/users/:username/favourites/
+// GET /api/accounts/users/:username/favourites/?cursor=…
 export const getUserFavs = async (
   fetcher: typeof fetch = fetch,
   username: string,
-  page = 1,
   pageSize = 24,
+  cursor: string | null = null,
 ): Promise<PaginatedFavourites> => {
-  const res = await fetcher(
-    `/api/accounts/users/${username}/favourites/?page=${page}&page_size=${pageSize}`,
-  )
+  const params = new URLSearchParams({ page_size: String(pageSize) })
+  if (cursor) params.set('cursor', cursor)
+  const res = await fetcher(`/api/accounts/users/${username}/favourites/?${params.toString()}`)
   if (res.status === 401 || res.status === 403) {
     throw new Error('Private account - cannot fetch favourites')
   }
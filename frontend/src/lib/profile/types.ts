@@ -21,8 +21,7 @@ export interface UserPreferences {
 }
 
 export interface PaginatedFavourites {
-  count: number
   next: string | null
-  previous: string | null
+  first: string
   results: { media: Media & { favourites_count: number }; added_at: string }[]
 }
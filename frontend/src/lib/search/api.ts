@@ -47,13 +47,11 @@ export const fetchSearchHistoryPreview = async (
 
 export const fetchSearchHistoryList = async (
   fetcher: typeof fetch = fetch,
-  page = 1,
   pageSize = 50,
+  cursor: string | null = null,
 ): Promise<PaginatedSearchHistory> => {
-  const params = new URLSearchParams({
-    page: String(page),
-    page_size: String(pageSize),
-  })
+  const params = new URLSearchParams({ page_size: String(pageSize) })
+  if (cursor) params.set('cursor', cursor)
   const res = await fetcher(`/api/search/history/?${params.toString()}`, { credentials: 'include' })
   if (!res.ok) throw new Error(`Failed to fetch history list: ${res.statusText}`)
   return res.json() as Promise<PaginatedSearchHistory>
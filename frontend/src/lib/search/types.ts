@@ -18,8 +18,7 @@ export interface SearchFilters {
 }
 
 export interface PaginatedSearchHistory {
-  count: number
   next: string | null
-  previous: string | null
+  first: string
   results: { id: number; search_key: string; search_value: string; searched_at: string }[]
 }
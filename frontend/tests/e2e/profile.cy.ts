@@ -79,7 +79,7 @@ describe('Profile flows', () => {
       }).as('getProfile')
       cy.intercept('GET', `/api/accounts/users/${user.username}/favourites/*`, {
         statusCode: 200,
-        body: { results: [], count: 0 },
+        body: { results: [], next: null },
       }).as('getFavs')
       cy.wait(['@getProfile', '@getFavs'])
 
@@ -122,19 +122,19 @@ describe('Profile flows', () => {
       // Page 1 using fixture; inject username into path if needed via `url.pathname`
       cy.intercept(
         'GET',
-        `/api/accounts/users/${user.username}/favourites/?page=1&page_size=${pageSize}`,
+        `/api/accounts/users/${user.username}/favourites/?page_size=${pageSize}`,
         { fixture: 'favourites-page1.json' },
       ).as('getFavs1')
 
       // Page 2
       cy.intercept(
         'GET',
-        `/api/accounts/users/${user.username}/favourites/?page=2&page_size=${pageSize}`,
+        `/api/accounts/users/${user.username}/favourites/?page_size=${pageSize}&cursor=abc`,
         { fixture: 'favourites-page2.json' },
       ).as('getFavs2')
 
       // Visit page 1
-      cy.visit(`/profile/${user.username}/favourites/?page=1&page_size=${pageSize}`)
+      cy.visit(`/profile/${user.username}/favourites/?page_size=${pageSize}`)
       cy.wait(['@getProfile', '@getFavs1'])
 
       // Expect 2 cards (from page1 fixture)
@@ -148,7 +148,7 @@ describe('Profile flows', () => {
       cy.get('[data-cy=media-card]').should('have.length', 1)
 
       // URL updated
-      cy.url().should('include', 'page=2')
+      cy.url().should('include', 'cursor=abc')
     })
   })
 })
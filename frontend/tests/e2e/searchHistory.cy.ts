@@ -53,13 +53,13 @@ describe('Search History page', () => {
 
     it('renders empty state', () => {
       // stub an empty list
-      cy.intercept('GET', `/api/search/history/?page=1&page_size=${pageSize}`, {
+      cy.intercept('GET', `/api/search/history/?page_size=${pageSize}`, {
         statusCode: 200,
-        body: { count: 0, next: null, previous: null, results: [] },
+        body: { next: null, first: '/api/search/history/', results: [] },
       }).as('getEmpty')
 
       // visit the page with the tokens set
-      cy.visit(`/search-history/?page=1&page_size=${pageSize}`, {
+      cy.visit(`/search-history/?page_size=${pageSize}`, {
         onBeforeLoad(win) {
           win.localStorage.setItem('accessToken', tokens.access)
           win.localStorage.setItem('refreshToken', tokens.refresh)
@@ -74,12 +74,12 @@ describe('Search History page', () => {
 
     it('renders a page of items and paginates', () => {
       // Stub page 1
-      cy.intercept('GET', `/api/search/history/?page=1&page_size=${pageSize}`, {
+      cy.intercept('GET', `/api/search/history/?page_size=${pageSize}`, {
         fixture: 'search-history-page1.json',
       }).as('getPage1')
 
-      // Visit with page=1
-      cy.visit(`/search-history/?page=1&page_size=${pageSize}`, {
+      // Visit the first page
+      cy.visit(`/search-history/?page_size=${pageSize}`, {
         onBeforeLoad(win) {
           win.localStorage.setItem('accessToken', tokens.access)
           win.localStorage.setItem('refreshToken', tokens.refresh)
@@ -93,8 +93,8 @@ describe('Search History page', () => {
       // Assert 2 items
       cy.get('[data-cy=search-history-item]').should('have.length', 2)
 
-      // Stub page 2 before clicking
-      cy.intercept('GET', `/api/search/history/?page=2&page_size=${pageSize}`, {
+      // Stub page 2, requested with the cursor from page 1's next link
+      cy.intercept('GET', `/api/search/history/?page_size=${pageSize}&cursor=abc`, {
         fixture: 'search-history-page2.json',
       }).as('getPage2')
 
@@ -108,17 +108,17 @@ describe('Search History page', () => {
       cy.get('[data-cy=search-history-item]').should('have.length', 1)
 
       // URL has updated
-      cy.url().should('include', 'page=2')
+      cy.url().should('include', 'cursor=abc')
     })
 
     it('deletes a single entry', () => {
       // assume page1 fixture loaded
-      cy.intercept('GET', `/api/search/history/?page=1&page_size=${pageSize}`, {
+      cy.intercept('GET', `/api/search/history/?page_size=${pageSize}`, {
         fixture: 'search-history-page1.json',
       }).as('getH1')
 
       // visit the page with the tokens set
-      cy.visit(`/search-history/?page=1&page_size=${pageSize}`, {
+      cy.visit(`/search-history/?page_size=${pageSize}`, {
         onBeforeLoad(win) {
           win.localStorage.setItem('accessToken', tokens.access)
           win.localStorage.setItem('refreshToken', tokens.refresh)
@@ -129,7 +129,7 @@ describe('Search History page', () => {
       cy.wait('@getH1')
 
       cy.intercept('DELETE', '/api/search/history/1/', { statusCode: 204 }).as('del1')
-      cy.intercept('GET', `/api/search/history/?page=1&page_size=${pageSize}`, {
+      cy.intercept('GET', `/api/search/history/?page_size=${pageSize}`, {
         fixture: 'search-history-page1-delete.json',
       }).as('getAfterDel')
 
@@ -145,12 +145,12 @@ describe('Search History page', () => {
     })
 
     it('clears all history', () => {
-      cy.intercept('GET', `/api/search/history/?page=1&page_size=${pageSize}`, {
+      cy.intercept('GET', `/api/search/history/?page_size=${pageSize}`, {
         fixture: 'search-history-page1.json',
       }).as('getH1')
 
       // visit the page with the tokens set
-      cy.visit(`/search-history/?page=1&page_size=${pageSize}`, {
+      cy.visit(`/search-history/?page_size=${pageSize}`, {
         onBeforeLoad(win) {
           win.localStorage.setItem('accessToken', tokens.access)
           win.localStorage.setItem('refreshToken', tokens.refresh)
@@ -161,9 +161,9 @@ describe('Search History page', () => {
       cy.wait('@getH1')
 
       cy.intercept('DELETE', '/api/search/history/clear/', { statusCode: 204 }).as('clear')
-      cy.intercept('GET', `/api/search/history/?page=1&page_size=${pageSize}`, {
+      cy.intercept('GET', `/api/search/history/?page_size=${pageSize}`, {
         statusCode: 200,
-        body: { count: 0, next: null, previous: null, results: [] },
+        body: { next: null, first: '/api/search/history/', results: [] },
       }).as('getEmpty')
 
       cy.get('[data-cy=clear-search-history]').should('not.be.disabled').click()
@@ -173,12 +173,12 @@ describe('Search History page', () => {
     })
 
     it('navigates to search results when clicking an entry', () => {
-      cy.intercept('GET', `/api/search/history/?page=1&page_size=${pageSize}`, {
+      cy.intercept('GET', `/api/search/history/?page_size=${pageSize}`, {
         fixture: 'search-history-page1.json',
       }).as('getH1')
 
       // visit the page with the tokens set
-      cy.visit(`/search-history/?page=1&page_size=${pageSize}`, {
+      cy.visit(`/search-history/?page_size=${pageSize}`, {
         onBeforeLoad(win) {
           win.localStorage.setItem('accessToken', tokens.access)
           win.localStorage.setItem('refreshToken', tokens.refresh)